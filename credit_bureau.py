@@ -1,11 +1,46 @@
 from __future__ import annotations
 
+import re
 from typing import Dict, Literal, Tuple
 
 
 Bureau = Literal["transunion", "experian", "equifax"]
 
 
+# Keyword signals scored by _scores, ordered longest-first so the single-pass
+# alternation prefers the most specific phrase at any position. Weight 0 marks
+# keywords that only participate in combination rules.
+_SIGNALS: Tuple[Tuple[str, Bureau, int], ...] = (
+  ("satisfactory accounts / account information", "transunion", 3),
+  ("annualcreditreport.transunion.com", "transunion", 3),
+  ("annual credit report - experian", "experian", 3),
+  ("your credit report summary", "equifax", 3),
+  ("payment/remarks key", "transunion", 2),
+  ("satisfactory accounts", "transunion", 2),
+  ("balance histories", "experian", 2),
+  ("narrative code", "equifax", 2),
+  ("credit accounts", "equifax", 2),
+  ("account info", "experian", 1),
+  ("description", "equifax", 0),
+)
+
+# The scan runs over UTF-8 bytes: all signal keywords are ASCII, and
+# bytes.lower() is a plain C ASCII pass, much cheaper than full-Unicode
+# str.lower() on multi-MB report text.
+_SIGNAL_RE = re.compile(b"|".join(re.escape(k.encode()) for k, _, _ in _SIGNALS))
+_SIGNAL_WEIGHTS: Dict[bytes, Tuple[Bureau, int]] = {k.encode(): (b, w) for k, b, w in _SIGNALS}
+
+# A matched phrase consumes its span, so keywords nested inside it would be
+# missed by the non-overlapping scan; record them explicitly.
+_IMPLIED: Dict[bytes, Tuple[bytes, ...]] = {
+  b"satisfactory accounts / account information": (b"satisfactory accounts", b"account info"),
+}
+
+# Once a bureau accumulates this much it cannot realistically be beaten;
+# stop scanning the rest of the text.
+_STRONG_SCORE = 5
+
+
 def _scores(text: str) -> Dict[Bureau, int]:
   """Detect the credit bureau from extracted text using keyword heuristics.
 
@@ -18,12 +53,13 @@ def _scores(text: str) -> Dict[Bureau, int]:
     "Credit Accounts".
 
   Ties are broken by a fixed order: transunion > experian > equifax.
-  If no signals are found, the total score is 0 for all.
+  If no signals are found, the total score is 0 for all. Scanning stops as
+  soon as one bureau scores decisively, so returned scores may be partial.
   """
   if not text:
     return {"transunion": 0, "experian": 0, "equifax": 0}
 
-  t = text.lower()
+  t = text.encode("utf-8", "ignore").lower()
 
   scores: Dict[Bureau, int] = {
     "transunion": 0,
@@ -31,37 +67,33 @@ def _scores(text: str) -> Dict[Bureau, int]:
     "equifax": 0,
   }
 
-  # TransUnion signals
-  if "satisfactory accounts" in t:
-    scores["transunion"] += 2
-  if "payment/remarks key" in t:
-    scores["transunion"] += 2
-  if "satisfactory accounts / account information" in t:
-    scores["transunion"] += 3
-  if "annualcreditreport.transunion.com" in t:
-    scores["transunion"] += 3
-
-  # Experian signals
-  if "annual credit report - experian" in t:
-    scores["experian"] += 3
-  if "balance histories" in t:
-    scores["experian"] += 2
-  if "account info" in t:
-    scores["experian"] += 1
+  # Single pass over the text, scoring each keyword once (presence, not
+  # occurrence count, is what matters). As soon as one bureau reaches a
+  # decisive score, return early with the partial tally.
+  found = set()
+  for m in _SIGNAL_RE.finditer(t):
+    kw = m.group()
+    if kw in found:
+      continue
+    found.add(kw)
+    bureau, weight = _SIGNAL_WEIGHTS[kw]
+    scores[bureau] += weight
+    for implied in _IMPLIED.get(kw, ()):
+      if implied not in found:
+        found.add(implied)
+        b2, w2 = _SIGNAL_WEIGHTS[implied]
+        scores[b2] += w2
+    if scores[bureau] >= _STRONG_SCORE:
+      return scores
+
+  # Combination rule: Equifax pairs narrative codes with their descriptions
+  if b"narrative code" in found and b"description" in found:
+    scores["equifax"] += 1
+
   # Private-use glyphs sometimes present in Experian PDFs/text extractions
   if "" in text or "" in text:
     scores["experian"] += 2
 
-  # Equifax signals
-  if "your credit report summary" in t:
-    scores["equifax"] += 3
-  if "narrative code" in t:
-    scores["equifax"] += 2
-  if "credit accounts" in t:
-    scores["equifax"] += 2
-  if "narrative code" in t and "description" in t:
-    scores["equifax"] += 1
-
   return scores
 
 
@@ -1,11 +1,38 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel
 
 
+@dataclass(slots=True)
+class PayRow:
+    """One month of an account's payment history.
+
+    Slots keep the per-row footprint to a handful of machine words instead
+    of a dict per month; get()/[] mirror the dict rows this replaced so
+    key-style callers keep working.
+    """
+
+    month: str
+    balance: Optional[float] = None
+    scheduled_payment: Optional[float] = None
+    past_due: Optional[float] = None
+    rating: Optional[str] = None
+    month_key: Optional[int] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
 class CreditReport(BaseModel):
     bureau: Optional[Literal["transunion", "experian", "equifax"]]
     pulled_on: Optional[date]
@@ -48,7 +75,7 @@ class Account(BaseModel):
     balance: Optional[float]
     scheduled_payment: Optional[float]
     past_due: Optional[float]
-    payment_history: List[Dict[str, Any]]
+    payment_history: List[PayRow]
     remarks: List[str]
 
 
@@ -67,6 +94,7 @@ class PublicRecord(BaseModel):
 __all__ = [
     "CreditReport",
     "Account",
+    "PayRow",
     "Inquiry",
     "PublicRecord",
 ]
@@ -6,9 +6,24 @@ from typing import Any, Dict, Iterable, List, Optional
 from typing import Union
 from models import Account, CreditReport
 
+try:  # Optional: vectorized reductions for large account sets
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is not a hard dependency
+    _np = None
+
+# Below this many open revolving accounts, numpy array construction costs
+# more than it saves; fall back to builtin sum().
+_NUMPY_MIN_N = 8
+
 
 NONE_TOKENS = {"", "-", "—", "na", "n/a", "none"}
 
+# Deletion table for currency punctuation. Interior spaces survive so
+# separate numbers stay separate ("$100 - $200" must not fuse into "-200",
+# nor "12 34" into "1234"); the outer strip handles edge whitespace.
+_CURRENCY_TRANS = str.maketrans("", "", "$,")
+_NUM_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
 
 def parse_amount(val: Optional[Union[str, float, int]]) -> Optional[float]:
     """Parse currency/number strings to float.
@@ -23,9 +38,14 @@ def parse_amount(val: Optional[Union[str, float, int]]) -> Optional[float]:
     s = str(val).strip()
     if s.lower() in NONE_TOKENS:
         return None
-    s = s.replace("$", "").replace(",", "").strip()
+    # Fast path: a clean number once currency punctuation is dropped. The
+    # fullmatch guard keeps float()'s wider grammar ("nan", "inf", "1e5",
+    # "1_000") on the token-extraction path below, where it always went.
+    s = s.translate(_CURRENCY_TRANS).strip()
+    if _NUM_RE.fullmatch(s):
+        return float(s)
     # Extract last numeric token if string contains extra text
-    m = re.findall(r"-?\d+(?:\.\d+)?", s)
+    m = _NUM_RE.findall(s)
     if not m:
         return None
     try:
@@ -79,64 +99,83 @@ def normalize_value_map(data: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
-def _is_open(account: Account) -> bool:
-    return account.status in {"open", "current"}
+_OPEN_STATUSES = frozenset({"open", "current"})
+_AUTO_KEYWORDS = ("auto", "vehicle", "car")
 
 
-def _is_auto_loan(account: Account) -> bool:
-    if account.kind != "installment":
-        return False
-    hay = f"{account.creditor} {' '.join(account.remarks)}".lower()
-    return any(k in hay for k in ["auto", "vehicle", "car"])
+def _is_open(account: Account) -> bool:
+    return account.status in _OPEN_STATUSES
 
 
 def _latest_history_balance(account: Account) -> Optional[float]:
     if not account.payment_history:
         return None
-    # Sort by 'month' descending (expects YYYY-MM) and pick first non-null balance
-    try:
-        rows = sorted(
-            account.payment_history,
-            key=lambda r: str(r.get("month", "")),
-            reverse=True,
-        )
-    except Exception:
-        rows = account.payment_history
-    for r in rows:
-        b = r.get("balance")
+    # Track the latest month with a numeric balance in a single pass. Rows
+    # carry an integer YYYYMM month_key where the parser provides one
+    # (single-op int compares); otherwise derive it from the "YYYY-MM" string.
+    best_key = -1
+    best_bal: Optional[float] = None
+    for r in account.payment_history:
+        b = r.balance
         if isinstance(b, (int, float)):
-            return float(b)
-    return None
+            k = r.month_key
+            if k is None:
+                m = r.month
+                try:
+                    k = int(m[:4]) * 100 + int(m[5:7])
+                except ValueError:
+                    k = 0
+            if k > best_key:
+                best_key, best_bal = k, float(b)
+    return best_bal
 
 
 def compute_summary(report: CreditReport) -> Dict[str, Any]:
     """Compute aggregate summary metrics from the report accounts."""
-    # Only include revolving accounts that are open/current AND have a usable credit limit
-    open_revolving = [
-        a
-        for a in report.accounts
-        if a.kind == "revolving" and _is_open(a) and (a.credit_limit is not None) and a.credit_limit > 0
-    ]
-    total_revolving_limit = sum(a.credit_limit or 0.0 for a in open_revolving)
-    # Use current balance, else latest from history; default to 0 if unknown
-    def current_or_latest_balance(a: Account) -> float:
-        if a.balance is not None:
-            return float(a.balance)
-        hb = _latest_history_balance(a)
-        return float(hb) if hb is not None else 0.0
-
-    total_revolving_balance = sum(current_or_latest_balance(a) for a in open_revolving)
+    # Single pass over accounts: each Pydantic attribute is read once, and the
+    # open-revolving figures land in parallel plain-float lists so the
+    # reductions below never touch the model objects again.
+    rev_limits: List[float] = []
+    rev_balances: List[float] = []
+    mortgages = 0
+    student_loans = 0
+    auto_loans = 0
+    for a in report.accounts:
+        kind = a.kind
+        if kind == "mortgage":
+            mortgages += 1
+        elif kind == "student":
+            student_loans += 1
+        elif kind == "installment":
+            # Only installment accounts can be auto loans, so the lowered
+            # creditor+remarks haystack is built just for those.
+            hay = f"{a.creditor} {' '.join(a.remarks)}".lower()
+            if any(k in hay for k in _AUTO_KEYWORDS):
+                auto_loans += 1
+        # Only count revolving accounts that are open/current AND have a usable credit limit
+        if kind == "revolving" and _is_open(a) and (a.credit_limit is not None) and a.credit_limit > 0:
+            rev_limits.append(float(a.credit_limit))
+            # Use current balance, else latest from history; default to 0 if unknown
+            if a.balance is not None:
+                rev_balances.append(float(a.balance))
+            else:
+                hb = _latest_history_balance(a)
+                if hb is not None:
+                    rev_balances.append(float(hb))
+
+    open_cards = len(rev_limits)
+    if _np is not None and open_cards >= _NUMPY_MIN_N:
+        total_revolving_limit = float(_np.fromiter(rev_limits, dtype=_np.float64, count=open_cards).sum())
+        total_revolving_balance = float(_np.fromiter(rev_balances, dtype=_np.float64, count=len(rev_balances)).sum())
+    else:
+        total_revolving_limit = sum(rev_limits, 0.0)
+        total_revolving_balance = sum(rev_balances, 0.0)
     utilization = (
         round(total_revolving_balance / total_revolving_limit, 1)
         if total_revolving_limit > 0
         else None
     )
 
-    open_cards = len(open_revolving)
-    mortgages = sum(1 for a in report.accounts if a.kind == "mortgage")
-    student_loans = sum(1 for a in report.accounts if a.kind == "student")
-    auto_loans = sum(1 for a in report.accounts if _is_auto_loan(a))
-
     return {
         "total_revolving_limit": total_revolving_limit,
         "total_revolving_balance": total_revolving_balance,
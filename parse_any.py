@@ -26,8 +26,18 @@ def parse_report(pdf_path: str) -> CreditReport:
   """
   text_result = extract_pdf_text(pdf_path)
   full_text: str = text_result.get("full_text", "")
+  pages = text_result.get("pages") or []
+  # Bureau signals live in the report header, so detect on the first few
+  # pages instead of cleaning and scanning the whole document up front.
+  if pages:
+    head_text = clean_text("\n".join(p["text"] for p in pages[:3]))
+  else:
+    head_text = clean_text(full_text)
+  bureau, scores = detect_bureau_with_scores(head_text)
+  if max(scores.values()) == 0 and len(pages) > 3:
+    # Rare: no signal in the head; widen to the full text before giving up
+    bureau, scores = detect_bureau_with_scores(clean_text(full_text))
   cleaned = clean_text(full_text)
-  bureau, scores = detect_bureau_with_scores(cleaned)
   if max(scores.values()) == 0:
     # Provide first 20 lines for debugging
     head = "\n".join(cleaned.splitlines()[:20])
@@ -36,20 +46,20 @@ def parse_report(pdf_path: str) -> CreditReport:
   if bureau == "transunion":
     from parse_transunion import parse as parse_tu
 
-    report = parse_tu(cleaned)
+    report = parse_tu(cleaned, already_cleaned=True)
   elif bureau == "experian":
     from parse_experian import parse as parse_exp
 
-    report = parse_exp(cleaned)
+    report = parse_exp(cleaned, already_cleaned=True)
   elif bureau == "equifax":
     from parse_equifax import parse as parse_eq
 
-    report = parse_eq(cleaned)
+    report = parse_eq(cleaned, already_cleaned=True)
   else:
     # Fallback: try Experian parser
     from parse_experian import parse as parse_exp
 
-    report = parse_exp(cleaned)
+    report = parse_exp(cleaned, already_cleaned=True)
 
   # Ensure bureau detected is aligned with parser choice
   report.bureau = bureau
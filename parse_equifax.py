@@ -2,59 +2,100 @@ from __future__ import annotations
 
 import re
 from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from models import Account, CreditReport, Inquiry
+from models import Account, CreditReport, Inquiry, PayRow
 from text_utils import clean_text
 
 
-SUMMARY_HDR = re.compile(r"^\s*Your Credit Report Summary\s*$", re.I | re.M)
-PERSONAL_HDR = re.compile(r"^\s*Personal Information\s*$", re.I | re.M)
-ACCOUNTS_HDR = re.compile(r"^\s*Credit Accounts\s*$", re.I | re.M)
-INQUIRIES_HDR = re.compile(r"^\s*Inquiries\s*$", re.I | re.M)
+# All section headers combined into one scanner so parse() finds every
+# anchor in a single pass instead of one full-text search per header.
+_HEADER_ORDER = ("your credit report summary", "personal information", "credit accounts", "inquiries")
+_HEADER_RE = re.compile(
+  r"^\s*(Your Credit Report Summary|Personal Information|Credit Accounts|Inquiries)\s*$",
+  re.I | re.M,
+)
 
 
-def _find_span(text: str, start_pat: re.Pattern[str], end_pats: Iterable[re.Pattern[str]]) -> Tuple[int, int]:
-  m = start_pat.search(text)
-  if not m:
-    return (-1, -1)
-  start = m.end()
-  end = len(text)
-  for pat in end_pats:
-    m2 = pat.search(text, start)
-    if m2:
-      end = min(end, m2.start())
-  return (start, end)
+def _header_spans(text: str) -> Dict[str, Tuple[int, int]]:
+  """Locate all section headers in one scan and derive each section's span.
+
+  A section runs from the end of its header to the first header of any
+  section later in the canonical order; headers that canonically precede a
+  section never terminate it (matching the old per-header span search).
+  """
+  occurrences = [(m.group(1).lower(), m.start(), m.end()) for m in _HEADER_RE.finditer(text)]
+  rank = {label: i for i, label in enumerate(_HEADER_ORDER)}
+  spans: Dict[str, Tuple[int, int]] = {}
+  for label in _HEADER_ORDER:
+    start = -1
+    for lbl, _, e in occurrences:
+      if lbl == label:
+        start = e
+        break
+    if start == -1:
+      spans[label] = (-1, -1)
+      continue
+    end = len(text)
+    r = rank[label]
+    for lbl, s, _ in occurrences:
+      if start <= s < end and rank[lbl] > r:
+        end = s
+    spans[label] = (start, end)
+  return spans
+
+
+_CURRENCY_TRANS = str.maketrans("", "", "$, ")
 
 
 def _to_float(s: Optional[str]) -> Optional[float]:
   if not s:
     return None
-  s2 = s.replace(",", "").replace("$", "").strip()
   try:
-    return float(s2)
+    return float(s.translate(_CURRENCY_TRANS))
   except Exception:
     return None
 
 
+_DATE_FORMATS = ("%m/%d/%Y", "%m/%Y", "%Y-%m", "%b %Y", "%b-%Y", "%Y")
+_ALPHA_MONTH_RE = re.compile(r"([A-Za-z]{3,9})\s+(\d{4})")
+_YYYY_MM_SEARCH_RE = re.compile(r"(\d{4})[-/](\d{2})")
+
+
 def _parse_date(s: Optional[str]) -> Optional[date]:
   if not s:
     return None
-  s = s.strip()
-  fmts = ["%m/%d/%Y", "%m/%Y", "%Y-%m", "%b %Y", "%b-%Y", "%Y"]
-  for f in fmts:
+  return _parse_date_cached(s.strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(s: str) -> Optional[date]:
+  # Shape dispatch: the dominant forms can be recognized from length and
+  # punctuation, so the common case tries exactly one strptime format.
+  try:
+    if len(s) == 10 and s[2] == "/" and s[5] == "/":
+      return datetime.strptime(s, "%m/%d/%Y").date()
+    if len(s) == 7:
+      if s[2] == "/":
+        return datetime.strptime(s, "%m/%Y").date()
+      if s[4] == "-":
+        return datetime.strptime(s, "%Y-%m").date()
+  except Exception:
+    pass
+  for f in _DATE_FORMATS:
     try:
       return datetime.strptime(s, f).date()
     except Exception:
       continue
-  m = re.search(r"([A-Za-z]{3,9})\s+(\d{4})", s)
+  m = _ALPHA_MONTH_RE.search(s)
   if m:
     for fmt in ("%b %Y", "%B %Y"):
       try:
         return datetime.strptime(f"{m.group(1)} {m.group(2)}", fmt).date()
       except Exception:
         pass
-  m = re.search(r"(\d{4})[-/](\d{2})", s)
+  m = _YYYY_MM_SEARCH_RE.search(s)
   if m:
     try:
       return datetime.strptime(f"{m.group(1)}-{m.group(2)}", "%Y-%m").date()
@@ -64,13 +105,45 @@ def _parse_date(s: Optional[str]) -> Optional[date]:
 
 
 MONTHS_ABBR = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-
-
-def _detect_months_header(block: str) -> Optional[List[str]]:
-  for ln in block.splitlines():
-    if re.search(r"\bJan\b.*\bDec\b", ln):
+_MONTH_MM = {m: f"{i + 1:02d}" for i, m in enumerate(MONTHS_ABBR)}
+
+# Precompiled patterns for the account-block hot path; compiling once at import
+# avoids the re._compile cache lookup on every call inside the per-block loops.
+_MONTHS_HEADER_RE = re.compile(r"\bJan\b.*\bDec\b")
+_MONTH_TOKEN_RE = re.compile(r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec")
+_YEAR_LINE_RE = re.compile(r"^\s*(?P<y>20\d{2})[:\-\s]+(?P<rest>.+)$")
+_WS_RE = re.compile(r"\s+")
+_ACCT_NUM_LINE_RE = re.compile(r"Account\s*Number", re.I)
+_CREDITOR_REJECT_RE = re.compile(
+  r":|Date|Balance|Status|Credit|Loan|Owner|Responsibil|Narrative|Payment|Account Type|High", re.I
+)
+_NARRATIVE_SPLIT_RE = re.compile(r",|;|/")
+
+# All labeled account fields combined into one alternation; a single finditer
+# pass over the block collects every field instead of one scan per label.
+# Values are captured inside lookaheads so a match consumes only its label
+# text and a second label on the same line is still found.
+_ACCT_FIELDS_RE = re.compile(
+  r"Account\s*Number\s*:?(?=\s*(?P<account_number>[^\n]+))"
+  r"|(?:Owner|Responsibility)\s*:?(?=\s*(?P<owner>[^\n]+))"
+  r"|Date\s*Opened\s*:?(?=\s*(?P<date_opened>[\w/\-]+))"
+  r"|Date\s*Closed\s*:?(?=\s*(?P<date_closed>[\w/\-]+))"
+  r"|Date\s*Reported\s*:?(?=\s*(?P<date_reported>[\w/\-]+))"
+  r"|\bBalance\s*:?(?=\s*(?P<balance>[$\d,\.]+))"
+  r"|Credit\s*Limit\s*:?(?=\s*(?P<credit_limit>[$\d,\.]+))"
+  r"|High\s*Credit\s*:?(?=\s*(?P<high_credit>[$\d,\.]+))"
+  r"|(?:Loan|Account)\s*Type\s*:?(?=\s*(?P<loan_type>[^\n]+))"
+  r"|Status\s*:?(?=\s*(?P<status>[^\n]+))"
+  r"|Narrative\s*Code\(s\)\s*:?(?=\s*(?P<narratives>[^\n]+))",
+  re.I,
+)
+
+
+def _detect_months_header(lines: List[str]) -> Optional[List[str]]:
+  for ln in lines:
+    if _MONTHS_HEADER_RE.search(ln):
       # Extract order of month tokens from the header line
-      toks = [t for t in re.findall(r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec", ln)]
+      toks = [t for t in _MONTH_TOKEN_RE.findall(ln)]
       if len(toks) >= 6:
         # Ensure unique order; fallback to default if weird
         seen = []
@@ -81,19 +154,25 @@ def _detect_months_header(block: str) -> Optional[List[str]]:
   return None
 
 
-def _parse_payment_grid(block: str) -> List[Dict[str, Any]]:
-  out: List[Dict[str, Any]] = []
-  months = _detect_months_header(block) or MONTHS_ABBR
+def _parse_payment_grid(lines: List[str]) -> List[PayRow]:
+  out: List[PayRow] = []
+  # Accounts with no yearly grid (every year key is 20\d{2}) skip the month
+  # header detection and line loop entirely
+  if not any("20" in ln for ln in lines):
+    return out
+  months = _detect_months_header(lines) or MONTHS_ABBR
   # Look for lines starting with a year followed by tokens (OK/30/60/etc.)
-  year_line = re.compile(r"^\s*(?P<y>20\d{2})[:\-\s]+(?P<rest>.+)$")
-  for ln in block.splitlines():
-    m = year_line.match(ln)
+  for ln in lines:
+    # Cheap prefilter: every year key starts with "20"; most lines have none
+    if "20" not in ln:
+      continue
+    m = _YEAR_LINE_RE.match(ln)
     if not m:
       continue
     y = int(m.group("y"))
     rest = m.group("rest")
     # Split by whitespace; filter empty
-    tokens = [t for t in re.split(r"\s+", rest) if t]
+    tokens = [t for t in _WS_RE.split(rest) if t]
     # Sometimes separators like '|' are used
     if "|" in rest and len(tokens) < 6:
       tokens = [t.strip() for t in rest.split("|") if t.strip()]
@@ -104,17 +183,17 @@ def _parse_payment_grid(block: str) -> List[Dict[str, Any]]:
       if rating in {"--", "ND", "N/A", "*"}:
         continue
       # Map month name to MM
-      try:
-        mm = f"{MONTHS_ABBR.index(mon.capitalize()) + 1:02d}"
-      except ValueError:
+      mm = _MONTH_MM.get(mon.capitalize())
+      if mm is None:
         continue
       out.append(
-        {
-          "month": f"{y}-{mm}",
-          "balance": None,
-          "scheduled_payment": None,
-          "rating": rating,
-        }
+        PayRow(
+          month=f"{y}-{mm}",
+          # Integer sort key (YYYYMM) so consumers can order rows without
+          # comparing month strings
+          month_key=y * 100 + int(mm),
+          rating=rating,
+        )
       )
   return out
 
@@ -144,6 +223,19 @@ def _map_kind(text: Optional[str]) -> Literal[
   return "other"
 
 
+# Status keywords combined into one scanner, longest/most specific first so
+# e.g. "never late" wins over "late" at the same position.
+_STATUS_KEYWORDS_RE = re.compile(
+  r"pays as agreed|never late|charge-off|charge off|chargeoff|delinquent"
+  r"|collection|transfer|closed|paid|sold|late|120|90|60|30"
+)
+# Keywords nested inside a longer match that the non-overlapping scan would
+# otherwise miss (plain substring checks used to see both).
+_STATUS_IMPLIED = {"never late": ("late",)}
+_CHARGEOFF_KEYS = frozenset({"charge-off", "charge off", "chargeoff"})
+_DELINQUENT_KEYS = frozenset({"30", "60", "90", "120", "late", "delinquent"})
+
+
 def _map_status(status: Optional[str], narratives: List[str]) -> Literal[
   "open",
   "closed",
@@ -158,42 +250,60 @@ def _map_status(status: Optional[str], narratives: List[str]) -> Literal[
   s = (status or "").lower()
   joined = (" ".join(narratives)).lower()
   hay = f"{s} {joined}"
-  if "pays as agreed" in hay or ("open" in s and "never late" in hay):
+  # One scan collects every status keyword; the priority ladder below then
+  # works off the resulting set instead of rescanning the haystack.
+  found = set()
+  for m in _STATUS_KEYWORDS_RE.finditer(hay):
+    kw = m.group()
+    if kw not in found:
+      found.add(kw)
+      found.update(_STATUS_IMPLIED.get(kw, ()))
+  if "pays as agreed" in found or ("open" in s and "never late" in found):
     return "current"
-  if "paid" in hay and "closed" in hay:
+  if "paid" in found and "closed" in found:
     return "closed"
-  if "transfer" in hay and "sold" in hay:
+  if "transfer" in found and "sold" in found:
     # Prefer sold if both present
     return "sold"
-  if "transfer" in hay:
+  if "transfer" in found:
     return "transferred"
-  if "sold" in hay:
+  if "sold" in found:
     return "sold"
-  if "collection" in hay:
+  if "collection" in found:
     return "collection"
-  if "charge-off" in hay or "charge off" in hay or "chargeoff" in hay:
+  if not found.isdisjoint(_CHARGEOFF_KEYS):
     return "chargeoff"
-  if any(k in hay for k in ["30", "60", "90", "120", "late", "delinquent"]):
+  if not found.isdisjoint(_DELINQUENT_KEYS):
     return "delinquent"
-  if "closed" in hay:
+  if "closed" in found:
     return "closed"
-  if "paid" in hay:
+  if "paid" in found:
     return "paid"
   return "open"
 
 
-def _extract_accounts(section: str) -> Tuple[List[Account], List[str]]:
+def _extract_accounts(section: str) -> List[Account]:
   accounts: List[Account] = []
-  raw_blocks: List[str] = []
 
   lines = section.splitlines()
+  # Cumulative character offset of each line start within `section`, so
+  # blocks can be addressed by span instead of re-joined per account.
+  offsets = [0]
+  for ln in lines:
+    offsets.append(offsets[-1] + len(ln) + 1)
   # Identify blocks around occurrences of "Account Number"
-  idxs = [i for i, ln in enumerate(lines) if re.search(r"Account\s*Number", ln, re.I)]
+  # Substring prefilter keeps the regex off lines that cannot mention an
+  # account number (both cases since the pattern is case-insensitive)
+  idxs = [
+    i
+    for i, ln in enumerate(lines)
+    if ("ccount" in ln or "CCOUNT" in ln) and _ACCT_NUM_LINE_RE.search(ln)
+  ]
   for k, i in enumerate(idxs):
     start = max(0, i - 8)
     end = idxs[k + 1] if k + 1 < len(idxs) else len(lines)
-    block = "\n".join(lines[start:end])
-    raw_blocks.append(block)
+    start_off = offsets[start]
+    end_off = offsets[end] - 1  # excludes the newline after the block's last line
 
     # creditor: first non-empty line above the Account Number that doesn't look like a label
     creditor = None
@@ -201,29 +311,33 @@ def _extract_accounts(section: str) -> Tuple[List[Account], List[str]]:
       cand = lines[j].strip()
       if not cand:
         continue
-      if re.search(r":|Date|Balance|Status|Credit|Loan|Owner|Responsibil|Narrative|Payment|Account Type|High", cand, re.I):
+      if _CREDITOR_REJECT_RE.search(cand):
         continue
       creditor = cand
       break
 
-    def find(pat: str) -> Optional[str]:
-      m = re.search(pat, block, re.I)
-      return m.group(1).strip() if m else None
-
-    account_number = find(r"Account\s*Number\s*:?\s*([^\n]+)")
-    owner = find(r"(?:Owner|Responsibility)\s*:?\s*([^\n]+)")
-    date_opened = _parse_date(find(r"Date\s*Opened\s*:?\s*([\w/\-]+)"))
-    date_closed = _parse_date(find(r"Date\s*Closed\s*:?\s*([\w/\-]+)"))
-    date_reported = _parse_date(find(r"Date\s*Reported\s*:?\s*([\w/\-]+)"))  # unused but may inform recency
-    balance = _to_float(find(r"\bBalance\s*:?\s*([$\d,\.]+)"))
-    credit_limit = _to_float(find(r"Credit\s*Limit\s*:?\s*([$\d,\.]+)"))
-    high_credit = _to_float(find(r"High\s*Credit\s*:?\s*([$\d,\.]+)"))
-    loan_type = find(r"(?:Loan|Account)\s*Type\s*:?\s*([^\n]+)")
-    status_raw = find(r"Status\s*:?\s*([^\n]+)")
-    narratives_line = find(r"Narrative\s*Code\(s\)\s*:?\s*([^\n]+)") or ""
-    narratives = [s.strip() for s in re.split(r",|;|/", narratives_line) if s.strip()]
-
-    payment_history = _parse_payment_grid(block)
+    # One pass over the block collects every labeled field; keep the first
+    # occurrence of each, matching the old per-pattern search order.
+    fields: Dict[str, str] = {}
+    for m in _ACCT_FIELDS_RE.finditer(section, start_off, end_off):
+      name = m.lastgroup
+      if name and name not in fields:
+        fields[name] = m.group(name).strip()
+
+    account_number = fields.get("account_number")
+    owner = fields.get("owner")
+    date_opened = _parse_date(fields.get("date_opened"))
+    date_closed = _parse_date(fields.get("date_closed"))
+    date_reported = _parse_date(fields.get("date_reported"))  # unused but may inform recency
+    balance = _to_float(fields.get("balance"))
+    credit_limit = _to_float(fields.get("credit_limit"))
+    high_credit = _to_float(fields.get("high_credit"))
+    loan_type = fields.get("loan_type")
+    status_raw = fields.get("status")
+    narratives_line = fields.get("narratives") or ""
+    narratives = [s.strip() for s in _NARRATIVE_SPLIT_RE.split(narratives_line) if s.strip()]
+
+    payment_history = _parse_payment_grid(lines[start:end])
 
     # Numeric guardrails and fallbacks
     def clamp_limit(x: Optional[float]) -> Optional[float]:
@@ -263,17 +377,16 @@ def _extract_accounts(section: str) -> Tuple[List[Account], List[str]]:
       )
     )
 
-  return accounts, raw_blocks
+  return accounts
 
 
 DATE_PAT = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})")
 
 
-def _parse_inquiries(section: str) -> Tuple[List[Inquiry], List[str]]:
+def _parse_inquiries(section: str) -> List[Inquiry]:
   inquiries: List[Inquiry] = []
-  blocks: List[str] = []
   if not section.strip():
-    return inquiries, blocks
+    return inquiries
 
   for ln in section.splitlines():
     if not ln.strip():
@@ -286,29 +399,32 @@ def _parse_inquiries(section: str) -> Tuple[List[Inquiry], List[str]]:
     if name and dt:
       # Treat as hard inquiries unless labeled otherwise (not commonly)
       inquiries.append(Inquiry(name=name, kind="hard", date=dt))
-      blocks.append(ln)
-  return inquiries, blocks
+  return inquiries
 
 
-def parse(text: str) -> CreditReport:
+def parse(text: str, *, already_cleaned: bool = False) -> CreditReport:
   """Parse an Equifax report text into a CreditReport model.
 
   Anchors: "Your Credit Report Summary", "Personal Information", "Credit Accounts", "Inquiries".
   Account blocks include many labeled fields and a yearly payment grid plus Narrative Codes.
+  Callers that already ran clean_text (parse_any) pass already_cleaned=True
+  to avoid re-cleaning the full text.
   """
-  text = clean_text(text)
-  summary_s, summary_e = _find_span(text, SUMMARY_HDR, [PERSONAL_HDR, ACCOUNTS_HDR, INQUIRIES_HDR])
-  personal_s, personal_e = _find_span(text, PERSONAL_HDR, [ACCOUNTS_HDR, INQUIRIES_HDR])
-  accounts_s, accounts_e = _find_span(text, ACCOUNTS_HDR, [INQUIRIES_HDR])
-  inquiries_s, inquiries_e = _find_span(text, INQUIRIES_HDR, [])
+  if not already_cleaned:
+    text = clean_text(text)
+  spans = _header_spans(text)
+  summary_s, summary_e = spans["your credit report summary"]
+  personal_s, personal_e = spans["personal information"]
+  accounts_s, accounts_e = spans["credit accounts"]
+  inquiries_s, inquiries_e = spans["inquiries"]
 
   summary_section = text[summary_s:summary_e] if summary_s != -1 else ""
   personal_section = text[personal_s:personal_e] if personal_s != -1 else ""
   accounts_section = text[accounts_s:accounts_e] if accounts_s != -1 else ""
   inquiries_section = text[inquiries_s:inquiries_e] if inquiries_s != -1 else ""
 
-  accounts, account_blocks = _extract_accounts(accounts_section)
-  inquiries, inquiry_blocks = _parse_inquiries(inquiries_section)
+  accounts = _extract_accounts(accounts_section)
+  inquiries = _parse_inquiries(inquiries_section)
 
   report = CreditReport(
     bureau="equifax",
@@ -318,13 +434,13 @@ def parse(text: str) -> CreditReport:
     inquiries=inquiries,
     public_records=[],
     summary={},
+    # Account and inquiry blocks are substrings of their sections; storing
+    # only the sections keeps raw_chunks from duplicating the text.
     raw_chunks=[
       summary_section,
       personal_section,
       accounts_section,
       inquiries_section,
-      *account_blocks,
-      *inquiry_blocks,
     ],
   )
   return report
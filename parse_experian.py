@@ -1,90 +1,290 @@
 from __future__ import annotations
 
 import re
+import sys
 from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from models import Account, CreditReport, Inquiry, PublicRecord
+from models import Account, CreditReport, Inquiry, PayRow, PublicRecord
 from text_utils import clean_text
 
 
-ACCOUNTS_HDR = re.compile(r"^\s*Accounts\s*$", re.I | re.M)
-PUBLIC_HDR = re.compile(r"^\s*Public\s+Records\s*$", re.I | re.M)
-HARD_HDR = re.compile(r"^\s*Hard\s+Inquiries\b.*$", re.I | re.M)
-SOFT_HDR = re.compile(r"^\s*Soft\s+Inquiries\b.*$", re.I | re.M)
+# Top-level section headers, found by a plain line walk in _header_spans
+# rather than a multiline regex; see _header_occurrences.
+_HEADER_ORDER = ("accounts", "public", "hard", "soft")
 ACCOUNT_INFO_HDR = re.compile(r"^\s*Account Info\s*$", re.I | re.M)
 BAL_HIST_HDR = re.compile(r"^\s*Balance Histories\s*$", re.I | re.M)
 
+# Patterns used inside per-card/per-row loops, compiled once at import time so
+# the hot paths skip the re._compile cache lookup on every call.
+_ALPHA_MONTH_RE = re.compile(r"([A-Za-z]{3,9})\s+(\d{4})")
+_YYYY_MM_RE = re.compile(r"(\d{4})[-/](\d{2})")
+_MM_YYYY_RE = re.compile(r"(\d{2})/(\d{4})")
+_DATE_PIPE_RE = re.compile(r"Date\s*\|")
+_BAL_ROW_RE = re.compile(
+  r"\s*(?P<month>(?:\d{4}[-/]\d{2}|[A-Za-z]{3,9}\s+\d{4}))\s+"
+  r"(?P<bal>[$\d,\.]+)\s+(?P<sch>[$\d,\.]+)\s+(?P<paid>\S+)"
+)
+_SECTION_BREAK_RE = re.compile(
+  r"Account Info|Payment History|Remarks|Status|Accounts|Public Records|Hard Inquiries|Soft Inquiries", re.I
+)
+# All labeled card fields in one alternation; a single finditer pass over the
+# block replaces ten independent full-block searches. Values are captured
+# inside lookaheads so a match consumes only its label text and a second
+# label on the same line is still found.
+_FIELDS_RE = re.compile(
+  r"Account Name:?(?=\s*(?P<account_name>[^\n]+))"
+  r"|Account Type:?(?=\s*(?P<account_type>[^\n]+))"
+  r"|Responsibility:?(?=\s*(?P<responsibility>[^\n]+))"
+  r"|Date Opened:?(?=\s*(?P<date_opened>[\w/\-]+))"
+  r"|Status:?(?=\s*(?P<status>[^\n]+))"
+  r"|Monthly Payment:?(?=\s*(?P<monthly_payment>[$\d,\.]+))"
+  r"|Credit Limit:?(?=\s*(?P<credit_limit>[$\d,\.]+))"
+  r"|Highest Balance:?(?=\s*(?P<highest_balance>[$\d,\.]+))"
+  r"|\bBalance:?(?=\s*(?P<balance>[$\d,\.]+))"
+  r"|(?:Account Number|Acct\s*#|Account\s*#)\s*:?(?=\s*(?P<masked_number>[^\n]+))",
+  re.I,
+)
+_INQUIRY_DATE_RE = re.compile(r"Inquiry\s*Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})", re.I)
+_HAS_ALPHA_RE = re.compile(r"[A-Za-z]")
+_NAME_REJECT_RE = re.compile(r"^Inquiry|Date|^\$|\d{3}[-\s]?\d{3}", re.I)
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n")
+_PR_TYPE_RE = re.compile(r"(bankruptcy|lien|judgment|foreclosure)", re.I)
+_ANY_DATE_LINE_RE = re.compile(r"\d{1,2}/\d{1,2}/|\d{4}-\d{2}-\d{2}")
 
-def _find_span(text: str, start_pat: re.Pattern[str], end_pats: Iterable[re.Pattern[str]]) -> Tuple[int, int]:
-  m = start_pat.search(text)
-  if not m:
-    return (-1, -1)
-  start = m.end()
-  end = len(text)
-  for pat in end_pats:
-    m2 = pat.search(text, start)
-    if m2:
-      end = min(end, m2.start())
-  return (start, end)
+
+def _header_occurrences(text: str) -> List[Tuple[str, int, int, int]]:
+  r"""Walk the text line by line and emit (label, start, line_start, end) anchors.
+
+  Equivalent to scanning with ^\s*Accounts\s*$ et al. under re.I | re.M,
+  but with per-line string compares instead of a regex pass: start covers
+  the whitespace run preceding the header (from the nearest line start) and
+  end sits at the last newline the old \s*$ would have consumed.
+  """
+  n = len(text)
+  occurrences: List[Tuple[str, int, int, int]] = []
+  ls = 0
+  while ls <= n:
+    le = text.find("\n", ls)
+    if le == -1:
+      le = n
+    line = text[ls:le]
+    stripped = line.strip()
+    if stripped:
+      # Canonical single-space form so tabs/odd spacing compare like \s+
+      norm = " ".join(stripped.lower().split())
+      label = None
+      trailing_ws = False
+      if norm == "accounts":
+        label, trailing_ws = "accounts", True
+      elif norm == "public records":
+        label, trailing_ws = "public", True
+      elif norm.startswith("hard inquiries") and not norm[14:15].isalnum():
+        label = "hard"
+      elif norm.startswith("soft inquiries") and not norm[14:15].isalnum():
+        label = "soft"
+      if label:
+        label_start = ls + (len(line) - len(line.lstrip()))
+        # Match start: earliest line start inside the whitespace run that
+        # precedes the header text
+        r0 = label_start
+        while r0 > 0 and text[r0 - 1].isspace():
+          r0 -= 1
+        if r0 == 0:
+          s = 0
+        else:
+          s = text.find("\n", r0, label_start) + 1
+        # Match end: full-line headers also swallowed trailing blank lines
+        # up to their last newline; Hard/Soft headers end with their line
+        if trailing_ws:
+          j = le
+          while j < n and text[j].isspace():
+            j += 1
+          e = n if j >= n else text.rfind("\n", 0, j)
+        else:
+          e = le
+        occurrences.append((label, s, ls, e))
+    if le >= n:
+      break
+    ls = le + 1
+  return occurrences
+
+
+def _header_spans(text: str) -> Dict[str, Tuple[int, int]]:
+  """Locate all section headers in one scan and derive each section's span.
+
+  A section runs from the end of its header to the first header of any
+  section later in the canonical order; headers that canonically precede a
+  section never terminate it. A terminator qualifies when its own line
+  starts at or after the span start; its whitespace run may reach further
+  back, so the anchor is clamped to the span start rather than discarded
+  (matching where the old ``^\s*`` search could re-anchor).
+  """
+  occurrences = _header_occurrences(text)
+  n = len(text)
+  rank = {label: i for i, label in enumerate(_HEADER_ORDER)}
+  spans: Dict[str, Tuple[int, int]] = {}
+  for label in _HEADER_ORDER:
+    start = -1
+    for lbl, _, _, e in occurrences:
+      if lbl == label:
+        start = e
+        break
+    if start == -1:
+      spans[label] = (-1, -1)
+      continue
+    # Earliest line start at or after `start` where a later header could
+    # anchor; -1 when no line starts after it.
+    if start == 0 or text[start - 1] == "\n":
+      s0 = start
+    else:
+      nl = text.find("\n", start)
+      s0 = nl + 1 if nl != -1 else -1
+    end = n
+    r = rank[label]
+    if s0 != -1:
+      for lbl, s, hls, _ in occurrences:
+        if rank[lbl] > r and hls >= s0:
+          cand = max(s, s0)
+          if cand < end:
+            end = cand
+    spans[label] = (start, end)
+  return spans
+
+
+# Deletion table so currency strings shed "$", "," and spaces in one C-level
+# pass instead of intermediate copies plus a strip (float() itself tolerates
+# surrounding whitespace, and the field patterns never capture inner spaces).
+_FLOAT_TRANS = str.maketrans("", "", ",$ ")
 
 
 def _to_float(s: Optional[str]) -> Optional[float]:
   if not s:
     return None
-  s2 = s.replace(",", "").replace("$", "").strip()
   try:
-    return float(s2)
+    return float(s.translate(_FLOAT_TRANS))
   except Exception:
     return None
 
 
+_DATE_FORMATS = ("%m/%d/%Y", "%m/%Y", "%Y-%m", "%b %Y", "%b-%Y", "%Y")
+
+_MONTH_NUM = {
+  "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+  "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+  "january": 1, "february": 2, "march": 3, "april": 4, "june": 6,
+  "july": 7, "august": 8, "september": 9, "october": 10,
+  "november": 11, "december": 12,
+}
+
+
+def _fast_date(s: str) -> Optional[date]:
+  """Decode the dominant date shapes by slicing, without strptime.
+
+  Recognizes mm/dd/yyyy, mm/yyyy, yyyy-mm and abbreviated "Mon yyyy" /
+  "Mon-yyyy"; the date() constructor supplies the same range validation
+  strptime would. Returns None for anything else so callers can fall back.
+  """
+  n = len(s)
+  try:
+    if n == 10 and s[2] == "/" and s[5] == "/":
+      if s[:2].isdigit() and s[3:5].isdigit() and s[6:].isdigit():
+        return date(int(s[6:]), int(s[:2]), int(s[3:5]))
+    elif n == 7:
+      if s[2] == "/" and s[:2].isdigit() and s[3:].isdigit():
+        return date(int(s[3:]), int(s[:2]), 1)
+      if s[4] == "-" and s[:4].isdigit() and s[5:].isdigit():
+        return date(int(s[:4]), int(s[5:]), 1)
+    elif n == 8 and (s[3] == " " or s[3] == "-") and s[4:].isdigit():
+      mon = _MONTH_NUM.get(s[:3].lower())
+      if mon:
+        return date(int(s[4:]), mon, 1)
+  except ValueError:
+    pass
+  return None
+
+
 def _parse_date(s: Optional[str]) -> Optional[date]:
   if not s:
     return None
-  s = s.strip()
-  fmts = ["%m/%d/%Y", "%m/%Y", "%Y-%m", "%b %Y", "%b-%Y", "%Y"]
-  for f in fmts:
+  return _parse_date_cached(s.strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(s: str) -> Optional[date]:
+  # The same date string repeats across rows and cards, so memoize, and
+  # decode the dominant shapes directly so common inputs raise no
+  # exceptions at all; strptime remains only for the odd stragglers.
+  d = _fast_date(s)
+  if d is not None:
+    return d
+  for f in _DATE_FORMATS:
     try:
       return datetime.strptime(s, f).date()
     except Exception:
       continue
-  m = re.search(r"([A-Za-z]{3,9})\s+(\d{4})", s)
+  m = _ALPHA_MONTH_RE.search(s)
   if m:
-    for fmt in ("%b %Y", "%B %Y"):
+    mon = _MONTH_NUM.get(m.group(1).lower())
+    if mon:
       try:
-        return datetime.strptime(f"{m.group(1)} {m.group(2)}", fmt).date()
-      except Exception:
+        return date(int(m.group(2)), mon, 1)
+      except ValueError:
         pass
-  m = re.search(r"(\d{4})[-/](\d{2})", s)
+  m = _YYYY_MM_RE.search(s)
   if m:
     try:
-      return datetime.strptime(f"{m.group(1)}-{m.group(2)}", "%Y-%m").date()
-    except Exception:
+      return date(int(m.group(1)), int(m.group(2)), 1)
+    except ValueError:
       pass
   return None
 
 
+def _parse_date_mdy(s: Optional[str]) -> Optional[date]:
+  """Parse dates from call sites that are almost always mm/dd/yyyy.
+
+  Inquiry and public-record dates overwhelmingly use the slash form, so the
+  exact shape is tried directly; anything else defers to the generic parser.
+  """
+  if not s:
+    return None
+  s = s.strip()
+  if len(s) == 10 and s[2] == "/" and s[5] == "/":
+    try:
+      return date(int(s[6:]), int(s[:2]), int(s[3:5]))
+    except ValueError:
+      pass
+  return _parse_date_cached(s)
+
+
+@lru_cache(maxsize=4096)
 def _month_to_yyyymm(s: str) -> Optional[str]:
   s = s.strip()
-  m = re.match(r"(\d{4})[-/](\d{2})", s)
+  m = _YYYY_MM_RE.match(s)
   if m:
     return f"{m.group(1)}-{m.group(2)}"
-  m = re.match(r"(\d{2})/(\d{4})", s)
+  m = _MM_YYYY_RE.match(s)
   if m:
     return f"{m.group(2)}-{m.group(1)}"
-  m = re.match(r"([A-Za-z]{3,9})\s+(\d{4})", s)
+  m = _ALPHA_MONTH_RE.match(s)
   if m:
-    for fmt in ("%b %Y", "%B %Y"):
-      try:
-        d = datetime.strptime(f"{m.group(1)} {m.group(2)}", fmt)
-        return d.strftime("%Y-%m")
-      except Exception:
-        pass
+    mon = _MONTH_NUM.get(m.group(1).lower())
+    if mon:
+      return f"{m.group(2)}-{mon:02d}"
   return None
 
 
-def _map_kind(account_type: Optional[str]) -> Literal[
+# Kind keywords in one alternation so the account type is scanned once;
+# "personal loan" precedes "loan" so the longer phrase wins at its position
+# (both land in the same bucket regardless).
+_KIND_KEYWORDS_RE = re.compile(
+  r"credit card|conventional|mortgage|education|student|lease|personal loan|installment|auto|loan"
+)
+_INSTALLMENT_KEYS = frozenset({"auto", "installment", "personal loan", "loan"})
+
+
+def _map_kind(at: str) -> Literal[
   "revolving",
   "mortgage",
   "installment",
@@ -93,23 +293,36 @@ def _map_kind(account_type: Optional[str]) -> Literal[
   "student",
   "other",
 ]:
-  at = (account_type or "").lower()
-  if "credit card" in at:
+  """Map a pre-lowercased account type string to a kind."""
+  found = {m.group() for m in _KIND_KEYWORDS_RE.finditer(at)}
+  if "credit card" in found:
     return "revolving"
-  if "mortgage" in at or "conventional" in at:
+  if "mortgage" in found or "conventional" in found:
     return "mortgage"
-  if "education" in at or "student" in at:
+  if "education" in found or "student" in found:
     return "student"
-  if "lease" in at:
+  if "lease" in found:
     return "lease"
-  if any(k in at for k in ["auto", "installment", "personal loan", "loan"]):
+  if found & _INSTALLMENT_KEYS:
     return "installment"
   if at.startswith("open"):
     return "open"
   return "other"
 
 
-def _map_status(status: Optional[str]) -> Literal[
+# Status keywords in one alternation, most specific first. "never late"
+# consumes its span in the non-overlapping scan, so the nested "late" it
+# would have satisfied is recorded via the implied map.
+_STATUS_KEYWORDS_RE = re.compile(
+  r"never late|transferred|collection|charge-off|charge off|chargeoff"
+  r"|delinquent|closed|paid|sold|open|late|30|60|90|120"
+)
+_STATUS_IMPLIED = {"never late": ("late",)}
+_CHARGEOFF_KEYS = frozenset({"charge-off", "charge off", "chargeoff"})
+_DELINQUENT_KEYS = frozenset({"30", "60", "90", "120", "late", "delinquent"})
+
+
+def _map_status(s: str) -> Literal[
   "open",
   "closed",
   "transferred",
@@ -120,132 +333,177 @@ def _map_status(status: Optional[str]) -> Literal[
   "delinquent",
   "current",
 ]:
-  s = (status or "").lower()
-  if "open" in s and "never late" in s:
+  """Map a pre-lowercased status string to the canonical status."""
+  found = set()
+  for m in _STATUS_KEYWORDS_RE.finditer(s):
+    kw = m.group()
+    found.add(kw)
+    found.update(_STATUS_IMPLIED.get(kw, ()))
+  if "open" in found and "never late" in found:
     return "current"
-  if "paid" in s and "closed" in s:
+  if "paid" in found and "closed" in found:
     return "closed"
-  if "transferred" in s:
+  if "transferred" in found:
     return "transferred"
-  if "sold" in s:
+  if "sold" in found:
     return "sold"
-  if "collection" in s:
+  if "collection" in found:
     return "collection"
-  if "charge-off" in s or "charge off" in s or "chargeoff" in s:
+  if found & _CHARGEOFF_KEYS:
     return "chargeoff"
-  if any(k in s for k in ["30", "60", "90", "120", "late", "delinquent"]):
+  if found & _DELINQUENT_KEYS:
     return "delinquent"
-  if "closed" in s:
+  if "closed" in found:
     return "closed"
-  if "paid" in s:
+  if "paid" in found:
     return "paid"
   return "open"
 
 
-def _parse_balance_histories(block: str) -> List[Dict[str, Any]]:
-  # Find the Balance Histories section within the account card
-  m = BAL_HIST_HDR.search(block)
-  out: List[Dict[str, Any]] = []
+def _parse_balance_histories(section: str, pos: int = 0, endpos: Optional[int] = None) -> List[PayRow]:
+  # Find the Balance Histories section within the account card; the card is
+  # addressed as a [pos, endpos) window of the section (always starting at a
+  # line boundary) so callers never materialize a block copy.
+  if endpos is None:
+    endpos = len(section)
+  m = BAL_HIST_HDR.search(section, pos, endpos)
+  out: List[PayRow] = []
   if not m:
     return out
-  tail = block[m.end():]
-  lines = tail.splitlines()
+  lines = section[m.end():endpos].splitlines()
 
   # Skip table header lines (containing Date | Balance | Scheduled Payment | Paid)
   i = 0
-  while i < len(lines) and not re.search(r"Date\s*\|", lines[i]):
+  while i < len(lines) and not _DATE_PIPE_RE.search(lines[i]):
     # Sometimes header line can be on the same or next line; advance cautiously
     i += 1
   if i < len(lines):
     i += 1  # move past header
 
+  # Sniff the delimiter once from the first non-empty data row; rows within
+  # a table are uniform, so the other branch is skipped in the loop below.
+  pipe_rows = False
   for ln in lines[i:]:
-    if not ln.strip():
+    if ln.strip():
+      pipe_rows = "|" in ln
+      break
+
+  # Hottest loop in the Experian parser: bind globals/methods to locals so
+  # each row costs plain fast-local loads instead of repeated dict lookups,
+  # and test blankness without allocating a stripped copy per line.
+  out_append = out.append
+  month_of = _month_to_yyyymm
+  to_float = _to_float
+  row_match = _BAL_ROW_RE.match
+  for ln in lines[i:]:
+    if not ln or ln.isspace():
       # Allow blanks; continue until next header/card
       continue
     # Accept pipe-separated or space-separated variants
     # Example: "Aug 2024 | $0 | $0 | Yes" or "2024-08  $0  $0  Yes"
-    parts = [p.strip() for p in ln.split("|")]
+    parts = [p.strip() for p in ln.split("|")] if pipe_rows else [ln]
     if len(parts) >= 4:
-      month = _month_to_yyyymm(parts[0])
+      month = month_of(parts[0])
       if not month:
         continue
-      out.append(
-        {
-          "month": month,
-          "balance": _to_float(parts[1]),
-          "scheduled_payment": _to_float(parts[2]),
-          "rating": parts[3],
-        }
+      out_append(
+        PayRow(
+          month=month,
+          balance=to_float(parts[1]),
+          scheduled_payment=to_float(parts[2]),
+          rating=parts[3],
+        )
       )
       continue
 
     # Fallback regex when not pipe-separated
-    mrow = re.match(
-      r"\s*(?P<month>(?:\d{4}[-/]\d{2}|[A-Za-z]{3,9}\s+\d{4}))\s+"
-      r"(?P<bal>[$\d,\.]+)\s+(?P<sch>[$\d,\.]+)\s+(?P<paid>\S+)",
-      ln,
-    )
+    mrow = row_match(ln)
     if mrow:
-      month = _month_to_yyyymm(mrow.group("month"))
+      month = month_of(mrow.group("month"))
       if not month:
         continue
-      out.append(
-        {
-          "month": month,
-          "balance": _to_float(mrow.group("bal")),
-          "scheduled_payment": _to_float(mrow.group("sch")),
-          "rating": mrow.group("paid"),
-        }
+      out_append(
+        PayRow(
+          month=month,
+          balance=to_float(mrow.group("bal")),
+          scheduled_payment=to_float(mrow.group("sch")),
+          rating=mrow.group("paid"),
+        )
       )
     else:
       # stop if another section header appears
-      if re.search(r"Account Info|Payment History|Remarks|Status|Accounts|Public Records|Hard Inquiries|Soft Inquiries", ln, re.I):
+      if _SECTION_BREAK_RE.search(ln):
         break
   return out
 
 
-def _parse_accounts(section: str) -> Tuple[List[Account], List[str]]:
+def _parse_accounts(section: str) -> List[Account]:
   accounts: List[Account] = []
-  raw_blocks: List[str] = []
 
-  lines = section.splitlines()
-  indices = [i for i, ln in enumerate(lines) if ACCOUNT_INFO_HDR.match(ln or "")]
-  for idx, i in enumerate(indices):
-    start_line = max(0, i - 5)  # include a few lines above for account header/name
-    end_line = indices[idx + 1] if idx + 1 < len(indices) else len(lines)
-    block_lines = lines[start_line:end_line]
-    block = "\n".join(block_lines)
-    raw_blocks.append(block)
-
-    # Creditor / Account Name
-    creditor = None
-    # Prefer labeled field if present
-    m = re.search(r"Account Name:?\s*([^\n]+)", block, re.I)
-    if m:
-      creditor = m.group(1).strip()
+  # One finditer over the section locates every Account Info header; blocks
+  # are then direct slices of the section instead of splitlines + re-join.
+  anchors: List[int] = []
+  for m in ACCOUNT_INFO_HDR.finditer(section):
+    # \s* in the header pattern can swallow preceding blank lines; step to
+    # the header text itself, then back to its line start.
+    q = m.start()
+    while section[q].isspace():
+      q += 1
+    anchors.append(section.rfind("\n", 0, q) + 1)
+
+  for idx, a in enumerate(anchors):
+    # Include up to five lines above the header for the account name
+    start_off = a
+    for _ in range(5):
+      if start_off == 0:
+        break
+      start_off = section.rfind("\n", 0, start_off - 1) + 1
+    end_off = anchors[idx + 1] - 1 if idx + 1 < len(anchors) else len(section)
+    if idx + 1 >= len(anchors) and section.endswith("\n"):
+      end_off -= 1
+
+    # One pass over the block; keep the first occurrence per field, matching
+    # the old independent searches. A "Highest Balance" line also satisfies
+    # the \bBalance search (the word is embedded), so record it for balance
+    # too when no plain Balance label came first.
+    fields: Dict[str, str] = {}
+    for m in _FIELDS_RE.finditer(section, start_off, end_off):
+      name = m.lastgroup or ""
+      if name not in fields:
+        val = m.group(name).strip()
+        # Values like "Individual" or "Open/Never late." repeat across every
+        # card; interning collapses the duplicates to one shared object
+        if len(val) < 64:
+          val = sys.intern(val)
+        fields[name] = val
+        if name == "highest_balance" and "balance" not in fields:
+          fields["balance"] = val
+
+    # Creditor / Account Name; prefer labeled field if present
+    creditor = fields.get("account_name")
     if not creditor:
-      # fallback: non-empty line above the Account Info header
-      for j in range(i - 1, start_line - 1, -1):
-        if lines[j].strip():
-          creditor = lines[j].strip()
+      # fallback: walk line starts back from the header until a non-empty
+      # line appears (within the lines included above the header)
+      p = a
+      while p > start_off:
+        ls = section.rfind("\n", 0, p - 1) + 1
+        cand = section[ls : p - 1].strip()
+        if cand:
+          creditor = cand
           break
+        p = ls
 
-    def find(pat: str) -> Optional[str]:
-      m = re.search(pat, block, re.I)
-      return m.group(1).strip() if m else None
-
-    account_type = find(r"Account Type:?\s*([^\n]+)")
-    responsibility = find(r"Responsibility:?\s*([^\n]+)")
-    date_opened = _parse_date(find(r"Date Opened:?\s*([\w/\-]+)"))
-    status_raw = find(r"Status:?\s*([^\n]+)")
-    monthly_payment = _to_float(find(r"Monthly Payment:?\s*([$\d,\.]+)"))
-    credit_limit = _to_float(find(r"Credit Limit:?\s*([$\d,\.]+)"))
-    highest_balance = _to_float(find(r"Highest Balance:?\s*([$\d,\.]+)"))
-    balance = _to_float(find(r"\bBalance:?\s*([$\d,\.]+)"))
-    masked_number = find(r"(?:Account Number|Acct\s*#|Account\s*#)\s*:?\s*([^\n]+)")
+    account_type = fields.get("account_type")
+    responsibility = fields.get("responsibility")
+    date_opened = _parse_date(fields.get("date_opened"))
+    status_raw = fields.get("status")
+    monthly_payment = _to_float(fields.get("monthly_payment"))
+    credit_limit = _to_float(fields.get("credit_limit"))
+    highest_balance = _to_float(fields.get("highest_balance"))
+    balance = _to_float(fields.get("balance"))
+    masked_number = fields.get("masked_number")
 
-    payment_history = _parse_balance_histories(block)
+    payment_history = _parse_balance_histories(section, start_off, end_off)
 
     # Numeric guardrails and fallbacks
     def clamp_limit(x: Optional[float]) -> Optional[float]:
@@ -272,8 +530,8 @@ def _parse_accounts(section: str) -> Tuple[List[Account], List[str]]:
       Account(
         creditor=creditor or "",
         masked_number=(masked_number or None),
-        kind=_map_kind(account_type),
-        status=_map_status(status_raw),
+        kind=_map_kind(account_type.lower() if account_type else ""),
+        status=_map_status(status_raw.lower() if status_raw else ""),
         responsibility=responsibility,
         opened_on=date_opened,
         closed_on=None,
@@ -287,7 +545,7 @@ def _parse_accounts(section: str) -> Tuple[List[Account], List[str]]:
       )
     )
 
-  return accounts, raw_blocks
+  return accounts
 
 
 DATE_PAT = re.compile(
@@ -295,56 +553,68 @@ DATE_PAT = re.compile(
 )
 
 
-def _parse_inquiries(section: str, kind: Literal["hard", "soft"]) -> Tuple[List[Inquiry], List[str]]:
+def _parse_inquiries(section: str, kind: Literal["hard", "soft"]) -> List[Inquiry]:
   inquiries: List[Inquiry] = []
-  blocks: List[str] = []
   if not section.strip():
-    return inquiries, blocks
+    return inquiries
 
   lines = section.splitlines()
   for i, ln in enumerate(lines):
     if not ln.strip():
       continue
+    # No digits, no date: skip both date regexes for the common name-only line
+    if not any(ch.isdigit() for ch in ln):
+      continue
     m = DATE_PAT.search(ln)
     if m:
-      dt = _parse_date(m.group(1))
+      dt = _parse_date_mdy(m.group(1))
       name = ln[: m.start()].strip(" -:") or (lines[i - 1].strip() if i > 0 else "")
       if name and dt:
         inquiries.append(Inquiry(name=name, kind=kind, date=dt))
-        blocks.append(ln)
         continue
     # Alternative format: "Inquiry Date: mm/dd/yyyy" possibly on same or next line
-    m2 = re.search(r"Inquiry\s*Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})", ln, re.I)
+    # (substring guard for both cases of the case-insensitive label)
+    if "nquiry" not in ln and "NQUIRY" not in ln:
+      continue
+    m2 = _INQUIRY_DATE_RE.search(ln)
     if m2:
-      dt = _parse_date(m2.group(1))
+      dt = _parse_date_mdy(m2.group(1))
       name = ln.split("Inquiry Date")[0].strip(" -:") or (lines[i - 1].strip() if i > 0 else "")
       if name and dt:
         inquiries.append(Inquiry(name=name, kind=kind, date=dt))
-        blocks.append(ln)
 
   # Fallback heuristic: some lines have the name and the date on the next line or offset by a bullet
   if not inquiries and kind == "hard":
+    # The 3-line windows below overlap, so find each line's date once up
+    # front instead of re-running DATE_PAT on the same line three times
+    date_matches = [
+      DATE_PAT.search(ln) if any(ch.isdigit() for ch in ln) else None for ln in lines
+    ]
+    if not any(date_matches):
+      return inquiries
     for i, ln in enumerate(lines):
-      # Skip headers/help lines
-      if re.search(r"Hard\s+Inquiries|Soft\s+Inquiries|Inquiries|help|about", ln, re.I):
+      # Skip headers/help lines (substring test; cheaper than a regex pass
+      # and equivalent to the old Hard/Soft/Inquiries|help|about alternation)
+      low = ln.lower()
+      if "inquiries" in low or "help" in low or "about" in low:
         continue
       # Look for a date on this or next two lines
       date_val: Optional[str] = None
       date_idx: Optional[int] = None
-      for j in range(0, 3):
-        k = i + j
-        if k < len(lines):
-          ml = DATE_PAT.search(lines[k])
-          if ml:
-            date_val = ml.group(1)
-            date_idx = k
-            break
+      for k in range(i, min(i + 3, len(lines))):
+        ml = date_matches[k]
+        if ml:
+          date_val = ml.group(1)
+          date_idx = k
+          break
       if not date_val:
         continue
       # Choose a name: prefer the line at i if it looks like a company name
       def looks_like_name(s: str) -> bool:
         s = s.strip(" -:\t\u2022\uf0b7")
-        return bool(re.search(r"[A-Za-z]", s)) and not re.search(r"^Inquiry|Date|^\$|\d{3}[-\s]?\d{3}", s, re.I)
+        if not s or not _HAS_ALPHA_RE.search(s):
+          return False
+        return not _NAME_REJECT_RE.search(s)
       candidates = []
       if looks_like_name(ln):
         candidates.append(ln)
@@ -356,83 +626,99 @@ def _parse_inquiries(section: str, kind: Literal["hard", "soft"]) -> Tuple[List[
       if date_idx is not None and date_idx + 1 < len(lines) and looks_like_name(lines[date_idx + 1]):
         candidates.append(lines[date_idx + 1])
       name = (candidates[0] if candidates else "").strip(" -:\t\u2022\uf0b7")
-      dt = _parse_date(date_val)
+      dt = _parse_date_mdy(date_val)
       if name and dt:
         inquiries.append(Inquiry(name=name, kind=kind, date=dt))
-        blocks.append(f"{name} {date_val}")
 
-  
-  return inquiries, blocks
+  return inquiries
 
 
-def _parse_public_records(section: str) -> Tuple[List[PublicRecord], List[str]]:
+def _parse_public_records(section: str) -> List[PublicRecord]:
   records: List[PublicRecord] = []
-  chunks: List[str] = []
   if not section.strip():
-    return records, chunks
-  # Heuristic: each non-empty paragraph with a recognizable type and date
-  paragraphs = [p.strip() for p in re.split(r"\n\s*\n", section) if p.strip()]
+    return records
+  # Heuristic: each non-empty paragraph with a recognizable type and date.
+  # After clean_text, separators are plain "\n\n" in practice; the regex
+  # split only runs when a whitespace-bearing blank line is present.
+  if "\n \n" in section or "\n\t\n" in section:
+    paragraphs = [p.strip() for p in _PARA_SPLIT_RE.split(section) if p.strip()]
+  else:
+    paragraphs = [p.strip() for p in section.split("\n\n") if p.strip()]
   for para in paragraphs:
     # Detect a type keyword
-    type_match = re.search(r"(bankruptcy|lien|judgment|foreclosure)", para, re.I)
-    date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", para)
+    type_match = _PR_TYPE_RE.search(para)
+    # Shared date alternation (same pattern the inquiry parser uses); also
+    # picks up ISO and "Mon d, yyyy" dates the old mm/dd/yyyy-only search
+    # missed in public-record paragraphs
+    date_match = DATE_PAT.search(para)
     pr_type = (type_match.group(1).lower() if type_match else "public_record")
-    pr_date = _parse_date(date_match.group(1)) if date_match else None
+    pr_date = _parse_date_mdy(date_match.group(1)) if date_match else None
     records.append(PublicRecord(type=pr_type, date=pr_date, details={"text": para}))
-    chunks.append(para)
-  return records, chunks
+  return records
 
 
-def parse(text: str) -> CreditReport:
+def parse(text: str, *, already_cleaned: bool = False) -> CreditReport:
   """Parse an Experian report text into a CreditReport model.
 
   Expected anchors: "Accounts", "Public Records", "Hard Inquiries", "Soft Inquiries".
   Each account card includes "Account Info" and a "Balance Histories" table:
   Date | Balance | Scheduled Payment | Paid.
+  Callers that already ran clean_text (parse_any) pass already_cleaned=True
+  to avoid re-cleaning the full text.
   """
-  text = clean_text(text)
-  acc_s, acc_e = _find_span(text, ACCOUNTS_HDR, [PUBLIC_HDR, HARD_HDR, SOFT_HDR])
+  if not already_cleaned:
+    text = clean_text(text)
+  spans = _header_spans(text)
+  acc_s, acc_e = spans["accounts"]
   accounts_section = text[acc_s:acc_e] if acc_s != -1 else ""
 
-  pub_s, pub_e = _find_span(text, PUBLIC_HDR, [HARD_HDR, SOFT_HDR])
+  pub_s, pub_e = spans["public"]
   public_section = text[pub_s:pub_e] if pub_s != -1 else ""
 
-  hard_s, hard_e = _find_span(text, HARD_HDR, [SOFT_HDR])
+  hard_s, hard_e = spans["hard"]
   hard_section = text[hard_s:hard_e] if hard_s != -1 else ""
 
-  soft_s, soft_e = _find_span(text, SOFT_HDR, [])
+  soft_s, soft_e = spans["soft"]
   soft_section = text[soft_s:soft_e] if soft_s != -1 else ""
 
-  accounts, account_blocks = _parse_accounts(accounts_section)
-  hard_inquiries, hard_blocks = _parse_inquiries(hard_section, "hard")
+  accounts = _parse_accounts(accounts_section)
+  hard_inquiries = _parse_inquiries(hard_section, "hard")
   # If section appears to have dates but parsing yielded none, add a minimal placeholder
   if not hard_inquiries and hard_section.strip():
-    m_any_date = re.search(
-      r"(\d{1,2}/\d{1,2}/\d{2,4}|\d{4}-\d{2}-\d{2}|[A-Za-z]{3,9}\s+\d{1,2},\s*\d{4})",
-      hard_section,
-    )
+    m_any_date = DATE_PAT.search(hard_section)
     if m_any_date:
-      dt = _parse_date(m_any_date.group(1))
-      # Choose a name: first non-header non-empty line in the section
-      lines_h = [ln.strip() for ln in hard_section.splitlines() if ln.strip()]
+      dt = _parse_date_mdy(m_any_date.group(1))
+      # Choose a name: first non-header non-empty line in the section.
+      # Walk lines directly instead of materializing a stripped list first;
+      # the loop usually stops within the first few lines.
       name = ""
-      for ln in lines_h:
-        if re.search(r"Hard\s+Inquiries|help|about|Your\s+report|This\s+section", ln, re.I):
+      for raw in hard_section.splitlines():
+        ln = raw.strip()
+        if not ln:
+          continue
+        low = ln.lower()
+        # Cheap substring/prefix guards before any regex work
+        if (
+          "hard inquiries" in low
+          or "help" in low
+          or "about" in low
+          or "your report" in low
+          or "this section" in low
+        ):
           continue
-        if re.search(r"\d{1,2}/\d{1,2}/|\d{4}-\d{2}-\d{2}", ln):
+        if ("/" in ln or "-" in ln) and _ANY_DATE_LINE_RE.search(ln):
           continue
-        if re.search(r"^Inquiry|^Date", ln, re.I):
+        if low.startswith(("inquiry", "date")):
           continue
-        if re.search(r"[A-Za-z]", ln):
+        if _HAS_ALPHA_RE.search(ln):
           name = ln
           break
       if not name:
         name = "Hard Inquiry"
       if dt:
         hard_inquiries.append(Inquiry(name=name, kind="hard", date=dt))
-        hard_blocks.append(f"{name} {dt}")
-  soft_inquiries, soft_blocks = _parse_inquiries(soft_section, "soft")
-  public_records, public_blocks = _parse_public_records(public_section)
+  soft_inquiries = _parse_inquiries(soft_section, "soft")
+  public_records = _parse_public_records(public_section)
 
   report = CreditReport(
     bureau="experian",
@@ -442,15 +728,13 @@ def parse(text: str) -> CreditReport:
     inquiries=[*hard_inquiries, *soft_inquiries],
     public_records=public_records,
     summary={},
+    # Account/record/inquiry blocks are substrings of these sections;
+    # storing only the sections keeps raw_chunks from duplicating the text.
     raw_chunks=[
       accounts_section,
       public_section,
       hard_section,
       soft_section,
-      *account_blocks,
-      *public_blocks,
-      *hard_blocks,
-      *soft_blocks,
     ],
   )
   return report
@@ -2,35 +2,262 @@ from __future__ import annotations
 
 import re
 from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from models import Account, CreditReport, Inquiry
+from models import Account, CreditReport, Inquiry, PayRow
 from text_utils import clean_text
 
+try:  # Optional: vectorized max for dense numeric fallback windows
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is not a hard dependency
+    _np = None
 
-ACCOUNTS_HDR = re.compile(r"^\s*Satisfactory Accounts\s*$", re.I | re.M)
-INQUIRIES_HDR = re.compile(r"^\s*Inquiries\s*$", re.I | re.M)
-PROMO_HDR = re.compile(r"^\s*Promotional Inquiries\s*$", re.I | re.M)
-REVIEW_HDR = re.compile(r"^\s*Account Review Inquiries\s*$", re.I | re.M)
-ACCOUNT_INFO_HDR = re.compile(r"^\s*Account Information\s*$", re.I | re.M)
+# Below this many extracted amounts, numpy array construction costs more
+# than it saves; fall back to builtin max().
+_NUMPY_MIN_N = 8
 
 
-def _find_span(text: str, start_pat: re.Pattern[str], end_pats: Iterable[re.Pattern[str]]) -> Tuple[int, int]:
-    m = start_pat.search(text)
-    if not m:
-        return (-1, -1)
-    start = m.end()
-    end = len(text)
-    for pat in end_pats:
-        m2 = pat.search(text, start)
-        if m2:
-            end = min(end, m2.start())
-    return (start, end)
+try:  # Optional: linear-time regex engine for whole-document scans
+    import re2 as _re2
+except ImportError:  # pragma: no cover - google-re2 is not a hard dependency
+    _re2 = None
+
+
+def _compile_scan(pattern: str) -> "re.Pattern[str]":
+    """Compile a whole-document scan pattern, preferring RE2 when installed.
+
+    RE2 runs these multi-MB header searches in guaranteed linear time; the
+    binding mirrors the re API, so callers never notice which engine won.
+    Falls back to re for patterns RE2 cannot express.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, _re2.IGNORECASE | _re2.MULTILINE)
+        except _re2.error:
+            pass
+    return re.compile(pattern, re.I | re.M)
+
+
+ACCOUNT_INFO_HDR = _compile_scan(r"^\s*Account Information\s*$")
+
+# Section labels recognized by the single header walk in _scan_headers,
+# keyed by the lowercased full-line text.
+_SECTION_LABELS = {
+    "satisfactory accounts": "accounts",
+    "inquiries": "inquiries",
+    "promotional inquiries": "promo",
+    "account review inquiries": "review",
+}
+
+# Patterns used inside per-account/per-row loops, compiled once at import time
+# so the hot paths skip the re._compile cache lookup on every call.
+_ALPHA_MONTH_PUNCT_RE = re.compile(r"([A-Za-z]{3})[\s/-](\d{4})")
+_YYYY_MM_RE = re.compile(r"(\d{4})[-/](\d{2})")
+_ALPHA_MONTH_RE = re.compile(r"([A-Za-z]{3,9})\s+(\d{4})")
+_MM_YYYY_RE = re.compile(r"(\d{2})/(\d{4})")
+_CURRENT_WORD_RE = re.compile(r"\bcurrent\b")
+# Kind needles in priority order; a single haystack walk replaces the chain
+# of per-needle `in` checks. ("open" has extra prefix semantics and stays a
+# special case in _map_kind.)
+_KIND_TABLE = (
+    ("revolving", "revolving"),
+    ("mortgage", "mortgage"),
+    ("installment", "installment"),
+    ("lease", "lease"),
+    ("student", "student"),
+)
+# Status keywords scanned in one pass (inputs are pre-lowered); ordering puts
+# longer phrases first so e.g. "120" wins over "30" inside the same token.
+# The priority ladder in _map_status then decides among whatever was found.
+_STATUS_SCAN_RE = re.compile(
+    r"current account|transferred|charge-off|charge off|chargeoff|collection"
+    r"|delinquent|closed|\bsold\b|paid|late|120|30|60|90"
+)
+_CHARGEOFF_KEYS = frozenset({"charge-off", "chargeoff", "charge off"})
+_DELINQUENT_KEYS = frozenset({"30", "60", "90", "120", "late", "delinquent"})
+_PH_HEADER_RE = re.compile(r"Balance\s*/\s*Past Due\s*/\s*Scheduled Payment\s*/\s*Rating", re.I)
+# Both row shapes (whitespace- and slash-separated columns) fused into one
+# multiline pattern so the table parses with a single finditer instead of a
+# Python loop probing two regexes per line. [^\S\n] is "horizontal
+# whitespace": the old patterns ran on split lines where \s could not cross
+# a newline, and the anchored form must keep that property.
+_PH_ROW_UNION = re.compile(
+    r"^[^\S\n]*(?P<month>\d{4}[-/]\d{2}|[A-Za-z]{3,9}[^\S\n]+\d{4})[^\S\n]+"
+    r"(?:(?P<bal>[$\d,\.]+)[^\S\n]+(?P<past>[$\d,\.]+)[^\S\n]+(?P<sch>[$\d,\.]+)[^\S\n]+(?P<rating>\S+)"
+    r"|(?P<bal2>[$\d,\.]+)[^\S\n]*/[^\S\n]*(?P<past2>[$\d,\.]+)[^\S\n]*/[^\S\n]*"
+    r"(?P<sch2>[$\d,\.]+)[^\S\n]*/[^\S\n]*(?P<rating2>\S+))",
+    re.M,
+)
+# Heading words that end a payment-history table. Plain substring tests on
+# the lowercased line replace the old regex alternation: str.__contains__ is
+# a C scan with none of the alternation overhead, and lowering the line
+# first keeps the match case-insensitive.
+_PH_STOP_WORDS = (
+    "account information",
+    "pay status",
+    "remarks",
+    "account type",
+    "satisfactory accounts",
+    "inquiries",
+    "promotional inquiries",
+    "account review inquiries",
+)
+# The twelve per-block field labels fused into one union so each account
+# block is scanned once instead of twelve times. Values are captured inside
+# lookaheads: a match consumes only its label, so a second label on the same
+# line is still found, which keeps parity with the independent searches.
+_ACCT_FIELDS_RE = re.compile(
+    r"Monthly Payment:?(?=\s*(?P<monthly_payment>[$\d,\.]+))"
+    r"|Date Opened:?(?=\s*(?P<date_opened>[\w/\-]+))"
+    r"|Date Closed:?(?=\s*(?P<date_closed>[\w/\-]+))"
+    r"|Responsibility:?(?=\s*(?P<responsibility>[^\n]+))"
+    r"|Account Type:?(?=\s*(?P<account_type>[^\n]+))"
+    r"|Loan Type:?(?=\s*(?P<loan_type>[^\n]+))"
+    r"|\bBalance:?(?=\s*(?P<balance>[$\d,\.]+))"
+    r"|Pay Status:?(?=\s*(?P<pay_status>[^\n]+))"
+    r"|Terms:?(?=\s*(?P<terms>[^\n]+))"
+    r"|(?:Account Number|Acct\s*#|Account\s*#)\s*:?(?=\s*(?P<masked_number>[^\n]+))"
+    r"|Past Due:?(?=\s*(?P<past_due>[$\d,\.]+))"
+    r"|Remarks:?(?=\s*(?P<remarks>[^\n]+))",
+    re.I,
+)
+# Credit-limit fallback ladder, most specific first. The patterns are fused
+# into one alternation so each block_ext is scanned once instead of six times;
+# the value groups v0..v5 keep the ladder's priority order, and v4/v5 still
+# get the NBSP strip their standalone searches applied.
+_CL_LADDER = (
+    ("v0", r"Credit Limit(?:\s*\(Hist\.\))?:?\s*(?P<v0>[$\d,\.]+)", False),
+    ("v1", r"Credit Limit\s*\(Hist\.\)\s*:?\s*(?P<v1>[$\d,\.]+)", False),
+    ("v2", r"Credit Limit[^\n]*?(?P<v2>[$\d,\.]+)", False),
+    ("v3", r"Credit Limit[^\n]*?\n\s*(?P<v3>[$\d,\.]+)", False),
+    ("v4", r"Credit\s*Limit[\s:\-\(\)A-Za-z/]*(?P<v4>[$\d,\.,\xa0]+)", True),
+    ("v5", r"\bLimit\b[^\n]*?(?P<v5>[$\d,\.,\xa0]+)", True),
+)
+_CL_UNION_RE = re.compile("|".join(p for _, p, _ in _CL_LADDER), re.I)
+_CL_LABEL_RE = re.compile(r"Credit\s*Limit", re.I)
+_CURRENCY_NUM_RE = re.compile(r"[$\s]*([\d,]+(?:\.\d+)?)")
+_HB_HIST_OPT_RE = re.compile(r"High Balance(?:\s*\(Hist\.\))?:?\s*([$\d,\.]+)", re.I)
+_HB_HIST_RE = re.compile(r"High Balance\s*\(Hist\.\)\s*:?\s*([$\d,\.]+)", re.I)
+_HB_LINE_RE = re.compile(r"High Balance[^\n]*?([$\d,\.]+)", re.I)
+_HB_NEXT_LINE_RE = re.compile(r"High Balance[^\n]*?\n\s*([$\d,\.]+)", re.I)
+_INQUIRY_DATE_LABEL_RE = re.compile(r"Inquiry Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})", re.I)
+
+
+def _scan_headers(text: str) -> List[Tuple[str, int, int, int]]:
+    r"""Locate every section header in one walk over the text's lines.
+
+    Returns (key, occ_start, hdr_ls, occ_end) per occurrence, in document
+    order, reproducing what the old ``^\s*<label>\s*$`` searches reported:
+    occ_start is the earliest line start of the whitespace run preceding the
+    label (where ``^\s*`` anchored), hdr_ls the label's own line start, and
+    occ_end the last newline swallowed by the trailing ``\s*$`` (or end of
+    text when the run reaches it).
+    """
+    out: List[Tuple[str, int, int, int]] = []
+    n = len(text)
+    ls = 0
+    while ls < n:
+        le = text.find("\n", ls)
+        if le == -1:
+            le = n
+        stripped = text[ls:le].strip()
+        if stripped:
+            key = _SECTION_LABELS.get(stripped.lower())
+            if key is not None:
+                occ_start = ls
+                while occ_start > 0:
+                    prev_ls = text.rfind("\n", 0, occ_start - 1) + 1
+                    if text[prev_ls : occ_start - 1].strip():
+                        break
+                    occ_start = prev_ls
+                k = le
+                last_nl = le
+                while k < n and text[k].isspace():
+                    if text[k] == "\n":
+                        last_nl = k
+                    k += 1
+                occ_end = n if k >= n else last_nl
+                out.append((key, occ_start, ls, occ_end))
+        ls = le + 1
+    return out
+
+
+def _section_spans(text: str) -> Dict[str, Tuple[int, int]]:
+    """Compute the four section spans from one _scan_headers pass.
+
+    Mirrors the old per-pattern _find_span calls: each span starts where its
+    header's match ended and is clipped at the first start of any
+    later-priority header found at or after that point.
+    """
+    occs = _scan_headers(text)
+    n = len(text)
+
+    def first_start_from(key: str, start: int) -> Optional[int]:
+        # Earliest line start at or after `start` where the header pattern
+        # could anchor; the run before a label is all whitespace, so any
+        # line start inside it is a valid anchor.
+        if start == 0 or text[start - 1] == "\n":
+            s0 = start
+        else:
+            nl = text.find("\n", start)
+            if nl == -1:
+                return None
+            s0 = nl + 1
+        for k, occ_start, hdr_ls, _ in occs:
+            if k == key and hdr_ls >= s0:
+                return max(occ_start, s0)
+        return None
+
+    spans: Dict[str, Tuple[int, int]] = {}
+    order = (
+        ("accounts", ("inquiries", "promo", "review")),
+        ("inquiries", ("promo", "review")),
+        ("promo", ("review",)),
+        ("review", ()),
+    )
+    for key, end_keys in order:
+        first = next((o for o in occs if o[0] == key), None)
+        if first is None:
+            spans[key] = (-1, -1)
+            continue
+        start = first[3]
+        end = n
+        for ek in end_keys:
+            cand = first_start_from(ek, start)
+            if cand is not None:
+                end = min(end, cand)
+        spans[key] = (start, end)
+    return spans
+
+
+def _amounts(chunk: str) -> List[float]:
+    """Tokenize every currency amount in a chunk in one pass.
+
+    The capture group only admits digits, commas and dots, so each token is
+    converted exactly once; tokens that are pure punctuation (e.g. a lone
+    comma) are dropped.
+    """
+    out: List[float] = []
+    for m in _CURRENCY_NUM_RE.finditer(chunk):
+        v = _to_float(m.group(1))
+        if v is not None:
+            out.append(v)
+    return out
+
+
+# Shape of the overwhelmingly common currency token ("$1,234.56" with
+# optional padding). Matching it up front lets _to_float build the float
+# with one translate pass and no exception handling; anything odder
+# (negatives, exponents, stray text) drops to the original path.
+_NUM_FULLMATCH_RE = re.compile(r"[\s$]*(\d[\d,]*(?:\.\d+)?)\s*")
+_NUM_STRIP = str.maketrans("", "", ",$ \xa0")
 
 
 def _to_float(s: Optional[str]) -> Optional[float]:
     if not s:
         return None
+    if _NUM_FULLMATCH_RE.fullmatch(s):
+        return float(s.translate(_NUM_STRIP))
     s2 = s.replace(",", "").replace("$", "").strip()
     try:
         return float(s2)
@@ -38,24 +265,79 @@ def _to_float(s: Optional[str]) -> Optional[float]:
         return None
 
 
+def _date_shape_fmt(s: str) -> Optional[str]:
+    """Pick the single strptime format a string's shape can satisfy.
+
+    Avoids raising ValueError for every non-matching format in the ladder;
+    strptime exceptions dominate the cost of date-heavy sections.
+    """
+    n = len(s)
+    if n == 10 and s[2] == "/" and s[5] == "/":
+        return "%m/%d/%Y"
+    if n == 7:
+        if s[2] == "/":
+            return "%m/%Y"
+        if s[4] == "-":
+            return "%Y-%m"
+    if n == 8:
+        if s[3] == " ":
+            return "%b %Y"
+        if s[3] == "-":
+            return "%b-%Y"
+    if n == 4 and s.isdigit():
+        return "%Y"
+    return None
+
+
+def _fast_date(s: str) -> Optional[date]:
+    """Decode the dominant numeric date shapes without strptime.
+
+    Handles MM/DD/YYYY, MM/YYYY and YYYY-MM by slicing digits directly;
+    the date() constructor still validates ranges. Returns None for any
+    other shape or out-of-range value.
+    """
+    n = len(s)
+    try:
+        if n == 10 and s[2] == "/" and s[5] == "/":
+            return date(int(s[6:]), int(s[:2]), int(s[3:5]))
+        if n == 7:
+            if s[2] == "/":
+                return date(int(s[3:]), int(s[:2]), 1)
+            if s[4] == "-":
+                return date(int(s[:4]), int(s[5:]), 1)
+    except ValueError:
+        return None
+    return None
+
+
 def _parse_date(s: Optional[str]) -> Optional[date]:
     if not s:
         return None
     s = s.strip()
-    fmts = ["%m/%d/%Y", "%m/%Y", "%Y-%m", "%b %Y", "%b-%Y", "%Y"]
-    for f in fmts:
+    d = _fast_date(s)
+    if d is not None:
+        return d
+    fmt = _date_shape_fmt(s)
+    if fmt is not None:
         try:
-            return datetime.strptime(s, f).date()
-        except Exception:
-            continue
+            return datetime.strptime(s, fmt).date()
+        except ValueError:
+            pass
+    else:
+        # Odd shapes (e.g. "1/2023") still get the full ladder
+        for f in ("%m/%d/%Y", "%m/%Y", "%Y-%m", "%b %Y", "%b-%Y", "%Y"):
+            try:
+                return datetime.strptime(s, f).date()
+            except Exception:
+                continue
     # Try to normalize MMM YYYY with extra punctuation
-    m = re.search(r"([A-Za-z]{3})[\s/-](\d{4})", s)
+    m = _ALPHA_MONTH_PUNCT_RE.search(s)
     if m:
         try:
             return datetime.strptime(f"{m.group(1)} {m.group(2)}", "%b %Y").date()
         except Exception:
             pass
-    m = re.search(r"(\d{4})[-/](\d{2})", s)
+    m = _YYYY_MM_RE.search(s)
     if m:
         try:
             return datetime.strptime(f"{m.group(1)}-{m.group(2)}", "%Y-%m").date()
@@ -66,12 +348,18 @@ def _parse_date(s: Optional[str]) -> Optional[date]:
 
 def _month_to_yyyymm(s: str) -> Optional[str]:
     s = s.strip()
+    # Fast shapes first: YYYY-MM / MM/YYYY need no regex at all
+    if len(s) == 7:
+        if s[4] == "-" and s[:4].isdigit() and s[5:].isdigit():
+            return f"{s[:4]}-{s[5:]}"
+        if s[2] == "/" and s[:2].isdigit() and s[3:].isdigit():
+            return f"{s[3:]}-{s[:2]}"
     # Try YYYY-MM
-    m = re.match(r"(\d{4})[-/](\d{2})", s)
+    m = _YYYY_MM_RE.match(s)
     if m:
         return f"{m.group(1)}-{m.group(2)}"
     # Try MMM YYYY
-    m = re.match(r"([A-Za-z]{3,9})\s+(\d{4})", s)
+    m = _ALPHA_MONTH_RE.match(s)
     if m:
         try:
             d = datetime.strptime(f"{m.group(1)} {m.group(2)}", "%b %Y")
@@ -82,7 +370,7 @@ def _month_to_yyyymm(s: str) -> Optional[str]:
                 return None
         return d.strftime("%Y-%m")
     # Try MM/YYYY
-    m = re.match(r"(\d{2})/(\d{4})", s)
+    m = _MM_YYYY_RE.match(s)
     if m:
         return f"{m.group(2)}-{m.group(1)}"
     return None
@@ -99,16 +387,10 @@ def _map_kind(account_type: str, loan_type: Optional[str]) -> Literal[
 ]:
     at = (account_type or "").lower()
     lt = (loan_type or "").lower()
-    if "revolving" in at or "revolving" in lt:
-        return "revolving"
-    if "mortgage" in at or "mortgage" in lt:
-        return "mortgage"
-    if "installment" in at or "installment" in lt:
-        return "installment"
-    if "lease" in at or "lease" in lt:
-        return "lease"
-    if "student" in at or "student" in lt:
-        return "student"
+    hay = f"{at} {lt}"
+    for needle, kind in _KIND_TABLE:
+        if needle in hay:
+            return kind
     if at.startswith("open") or "open account" in at:
         return "open"
     return "other"
@@ -128,187 +410,219 @@ def _map_status(pay_status: str, remarks: List[str]) -> Literal[
     ps = (pay_status or "").lower()
     joined = " ".join(remarks).lower()
     hay = f"{ps} {joined}"
-    if "current account" in hay or re.search(r"\bcurrent\b", ps):
+    found = {m.group() for m in _STATUS_SCAN_RE.finditer(hay)}
+    if "current account" in found or _CURRENT_WORD_RE.search(ps):
         return "current"
-    if "paid" in hay and "closed" in hay:
+    if "paid" in found and "closed" in found:
         return "closed"
-    if "transferred" in hay:
+    if "transferred" in found:
         return "transferred"
-    if re.search(r"\bsold\b", hay):
+    if "sold" in found:
         return "sold"
-    if "collection" in hay:
+    if "collection" in found:
         return "collection"
-    if "charge-off" in hay or "chargeoff" in hay or "charge off" in hay:
+    if found & _CHARGEOFF_KEYS:
         return "chargeoff"
-    if any(k in hay for k in ["30", "60", "90", "120", "late", "delinquent"]):
+    if found & _DELINQUENT_KEYS:
         return "delinquent"
     # Fallbacks
-    if "closed" in hay:
+    if "closed" in found:
         return "closed"
     return "open"
 
 
-def _parse_payment_history(block: str) -> List[Dict[str, Any]]:
-    # Look for header indicating table
-    out: List[Dict[str, Any]] = []
-    if not re.search(r"Balance\s*/\s*Past Due\s*/\s*Scheduled Payment\s*/\s*Rating", block, re.I):
-        return out
-
-    # Lines after the header until a blank line or next header-like string
-    lines = block.splitlines()
-    start = None
-    for i, ln in enumerate(lines):
-        if re.search(r"Balance\s*/\s*Past Due\s*/\s*Scheduled Payment\s*/\s*Rating", ln, re.I):
-            start = i + 1
+def _parse_payment_history(block: str) -> List[PayRow]:
+    # Look for the header line indicating the table (single-line occurrence)
+    out: List[PayRow] = []
+    hm = None
+    for cand in _PH_HEADER_RE.finditer(block):
+        if "\n" not in cand.group():
+            hm = cand
             break
-    if start is None:
+    if hm is None:
+        return out
+    start = block.find("\n", hm.end())
+    if start == -1:
         return out
+    start += 1
+
+    # The table ends at the first heading-like line that is neither blank
+    # nor a data row; rows before it are collected in one multiline scan.
+    # Expect rows like: "Aug 2024   $120  $0  $120  OK"
+    # or "2024-08 $120 / $0 / $120 / 30"
+    nblock = len(block)
+    end = nblock
+    ls = start
+    while ls < nblock:
+        nl = block.find("\n", ls)
+        le = nl if nl != -1 else nblock
+        low = block[ls:le].lower()
+        if any(w in low for w in _PH_STOP_WORDS) and not _PH_ROW_UNION.match(
+            block, ls
+        ):
+            end = ls
+            break
+        ls = le + 1
 
-    for ln in lines[start:]:
-        if not ln.strip():
-            # Allow blank lines within a multi-page table; continue until next header
-            continue
-        # Expect something like: "Aug 2024   $120  $0  $120  OK"
-        # or "2024-08 $120 $0 $120 30"
-        m = re.match(
-            r"\s*(?P<month>(?:\d{4}[-/]\d{2}|[A-Za-z]{3,9}\s+\d{4}))\s+"
-            r"(?P<bal>[$\d,\.]+)\s+(?P<past>[$\d,\.]+)\s+(?P<sch>[$\d,\.]+)\s+(?P<rating>\S+)",
-            ln,
-        )
-        if not m:
-            # Some rows may have month then columns separated by slashes
-            m2 = re.match(
-                r"\s*(?P<month>(?:\d{4}[-/]\d{2}|[A-Za-z]{3,9}\s+\d{4}))\s+"
-                r"(?P<bal>[$\d,\.]+)\s*/\s*(?P<past>[$\d,\.]+)\s*/\s*(?P<sch>[$\d,\.]+)\s*/\s*(?P<rating>\S+)",
-                ln,
-            )
-            if not m2:
-                # Stop if we hit another heading-like line
-                if re.search(r"Account Information|Pay Status|Remarks|Account Type|Satisfactory Accounts|Inquiries|Promotional Inquiries|Account Review Inquiries", ln, re.I):
-                    break
-                continue
-            m = m2
+    for m in _PH_ROW_UNION.finditer(block, start, end):
         month = _month_to_yyyymm(m.group("month"))
         if not month:
             continue
+        bal, past, sch, rating = m.group("bal", "past", "sch", "rating")
+        if bal is None:
+            bal, past, sch, rating = m.group("bal2", "past2", "sch2", "rating2")
         out.append(
-            {
-                "month": month,
-                "balance": _to_float(m.group("bal")),
-                "scheduled_payment": _to_float(m.group("sch")),
-                "past_due": _to_float(m.group("past")),
-                "rating": m.group("rating"),
-            }
+            PayRow(
+                month=month,
+                balance=_to_float(bal),
+                scheduled_payment=_to_float(sch),
+                past_due=_to_float(past),
+                rating=rating,
+            )
         )
     return out
 
 
-def _parse_accounts(section: str) -> Tuple[List[Account], List[str]]:
+def _parse_accounts(section: str) -> List[Account]:
     accounts: List[Account] = []
-    raw_blocks: List[str] = []
-
-    # Identify every "Account Information" occurrence and build blocks
-    lines = section.splitlines()
-    indices = [i for i, ln in enumerate(lines) if ACCOUNT_INFO_HDR.match(ln or "")]
-    for idx, i in enumerate(indices):
-        start_line = max(0, i - 3)  # include a couple lines before to catch creditor name
-        end_line = indices[idx + 1] if idx + 1 < len(indices) else len(lines)
-        block_lines = lines[start_line:end_line]
-        # Creditor is the non-empty line immediately above the heading
-        creditor = None
-        for j in range(i - 1, start_line - 1, -1):
-            if lines[j].strip():
-                creditor = lines[j].strip()
-                break
-        # Extend search window slightly beyond the next header to capture trailing fields
-        extended_end = min(end_line + 20, len(lines))
-        block_ext_lines = lines[start_line:extended_end]
-        block = "\n".join(block_lines)
-        block_ext = "\n".join(block_ext_lines)
-        raw_blocks.append(block)
-
-        # Field extraction within the block
-        def find(pattern: str) -> Optional[str]:
-            m = re.search(pattern, block, re.I)
-            return m.group(1).strip() if m else None
 
-        monthly_payment = _to_float(find(r"Monthly Payment:?\s*([$\d,\.]+)"))
-        date_opened = _parse_date(find(r"Date Opened:?\s*([\w/\-]+)"))
-        date_closed = _parse_date(find(r"Date Closed:?\s*([\w/\-]+)"))
-        responsibility = find(r"Responsibility:?\s*([^\n]+)")
-        account_type = find(r"Account Type:?\s*([^\n]+)")
-        loan_type = find(r"Loan Type:?\s*([^\n]+)")
-        balance = _to_float(find(r"\bBalance:?\s*([$\d,\.]+)"))
+    # Identify every "Account Information" occurrence by offset and slice the
+    # section directly; no line list or per-block join is materialized. The
+    # header pattern's \s* can swallow surrounding blank lines, so each match
+    # is normalized to the start of the line holding the header text.
+    n = len(section)
+    anchors: List[int] = []
+    for hm in ACCOUNT_INFO_HDR.finditer(section):
+        q = hm.start()
+        while section[q].isspace():
+            q += 1
+        anchors.append(section.rfind("\n", 0, q) + 1)
+    # One forward pass records the start of the last non-empty line above
+    # each heading, so the creditor lookup below is a plain index instead of
+    # a backward walk per account.
+    prev_ne: List[int] = []
+    pos = 0
+    last_ne = -1
+    for hdr_ls in anchors:
+        while pos < hdr_ls:
+            nl = section.find("\n", pos)
+            if section[pos:nl].strip():
+                last_ne = pos
+            pos = nl + 1
+        prev_ne.append(last_ne)
+    # The section text joined from lines never carries the final newline;
+    # mirror that for the last block's end offset.
+    tail_end = n - 1 if section.endswith("\n") else n
+    for idx, hdr_ls in enumerate(anchors):
+        # Include up to three lines before the heading to catch the creditor
+        start_off = hdr_ls
+        for _ in range(3):
+            if start_off == 0:
+                break
+            start_off = section.rfind("\n", 0, start_off - 1) + 1
+        next_ls = anchors[idx + 1] if idx + 1 < len(anchors) else None
+        end_off = next_ls - 1 if next_ls is not None else tail_end
+        # Creditor is the non-empty line immediately above the heading, as
+        # long as it falls inside the three-line window
+        creditor = None
+        ne = prev_ne[idx]
+        if ne >= start_off and ne < hdr_ls:
+            creditor = section[ne : section.find("\n", ne, hdr_ls)].strip()
+        # Extend the search window slightly beyond the next header to capture
+        # trailing fields (up to 20 lines)
+        if next_ls is None:
+            ext_off = end_off
+        else:
+            p = next_ls
+            ext_off = -1
+            for _ in range(20):
+                nx = section.find("\n", p)
+                if nx == -1:
+                    ext_off = tail_end
+                    break
+                p = nx + 1
+            if ext_off == -1:
+                ext_off = p - 1
+        block = section[start_off:end_off]
+        block_ext = section[start_off:ext_off]
+
+        # Field extraction within the block: one scan collects the first
+        # occurrence of every label
+        fields: Dict[str, str] = {}
+        for fm in _ACCT_FIELDS_RE.finditer(block):
+            fname = fm.lastgroup
+            if fname is not None and fname not in fields:
+                fields[fname] = fm.group(fname).strip()
+
+        monthly_payment = _to_float(fields.get("monthly_payment"))
+        date_opened = _parse_date(fields.get("date_opened"))
+        date_closed = _parse_date(fields.get("date_closed"))
+        responsibility = fields.get("responsibility")
+        account_type = fields.get("account_type")
+        loan_type = fields.get("loan_type")
+        balance = _to_float(fields.get("balance"))
         # Prefer searches on extended block for fields that may trail
-        def find_ext(pattern: str) -> Optional[str]:
-            m = re.search(pattern, block_ext, re.I)
+        def find_ext(pat: re.Pattern[str]) -> Optional[str]:
+            m = pat.search(block_ext)
             return m.group(1).strip() if m else None
 
-        credit_limit = _to_float(find_ext(r"Credit Limit(?:\s*\(Hist\.\))?:?\s*([$\d,\.]+)"))
-        if credit_limit is None:
-            credit_limit = _to_float(find_ext(r"Credit Limit\s*\(Hist\.\)\s*:?\s*([$\d,\.]+)"))
-        if credit_limit is None:
-            # Fallback: capture any amount on the 'Credit Limit' line
-            credit_limit = _to_float(find_ext(r"Credit Limit[^\n]*?([$\d,\.]+)"))
-        if credit_limit is None:
-            # Fallback: number may be on next line after the label
-            mcl = re.search(r"Credit Limit[^\n]*?\n\s*([$\d,\.]+)", block_ext, re.I)
-            if mcl:
-                credit_limit = _to_float(mcl.group(1))
-        if credit_limit is None:
-            # Broad fallback: search anywhere after the label within 80 chars
-            mcl2 = re.search(r"Credit\s*Limit[\s:\-\(\)A-Za-z/]*([$\d,\.,\xa0]+)", block_ext, re.I)
-            if mcl2:
-                amt = mcl2.group(1).replace("\xa0", "")
-                credit_limit = _to_float(amt)
-        if credit_limit is None:
-            # Very broad fallback: any 'Limit' label with amount
-            mcl3 = re.search(r"\bLimit\b[^\n]*?([$\d,\.,\xa0]+)", block_ext, re.I)
-            if mcl3:
-                credit_limit = _to_float(mcl3.group(1).replace("\xa0", ""))
+        # One scan of block_ext collects the first hit per ladder pattern
+        # (the match's lastgroup is its value group); the priority walk below
+        # then mirrors the old six-step cascade exactly.
+        cl_hits: Dict[str, str] = {}
+        for mcl in _CL_UNION_RE.finditer(block_ext):
+            g = mcl.lastgroup
+            if g is not None and g not in cl_hits:
+                cl_hits[g] = mcl.group(g)
+        credit_limit = None
+        for name, _, strip_nbsp in _CL_LADDER:
+            raw = cl_hits.get(name)
+            if raw is not None:
+                credit_limit = _to_float(raw.replace("\xa0", "") if strip_nbsp else raw)
+                if credit_limit is not None:
+                    break
         if credit_limit is None:
             # Heuristic: grab the largest currency amount near the 'Credit Limit' label
-            pos = re.search(r"Credit\s*Limit", block_ext, re.I)
+            pos = _CL_LABEL_RE.search(block_ext)
             if pos:
                 window = block_ext[pos.start() : pos.start() + 1500]
-                nums = re.findall(r"[$\s]*([\d,]+(?:\.\d+)?)", window)
-                if nums:
-                    vals = [
-                        _to_float(n.replace("\xa0", "")) for n in nums if _to_float(n) is not None
-                    ]
-                    if vals:
-                        credit_limit = max(vals)  # choose max as limit
+                vals = _amounts(window)
+                if vals:
+                    # choose max as limit
+                    if _np is not None and len(vals) >= _NUMPY_MIN_N:
+                        credit_limit = float(_np.fromiter(vals, dtype=_np.float64, count=len(vals)).max())
+                    else:
+                        credit_limit = max(vals)
         if credit_limit is None:
             # Final fallback: pick a large currency value in the account block as limit candidate
-            nums_all = re.findall(r"[$\s]*([\d,]+(?:\.\d+)?)", block_ext)
-            vals_all = [
-                _to_float(n.replace("\xa0", "")) for n in nums_all if _to_float(n) is not None
-            ]
             # Prefer values >= 10000 as plausible limits for revolving accounts
-            candidates = [v for v in vals_all if v is not None and v >= 10000]
+            candidates = [v for v in _amounts(block_ext) if v >= 10000]
             if candidates:
                 # If we have a known balance, ensure limit exceeds it by some margin
-                best = max(candidates)
+                if _np is not None and len(candidates) >= _NUMPY_MIN_N:
+                    best = float(_np.fromiter(candidates, dtype=_np.float64, count=len(candidates)).max())
+                else:
+                    best = max(candidates)
                 if balance is None or best >= max(balance * 1.5, 1000):
                     credit_limit = best
-        high_balance = _to_float(find_ext(r"High Balance(?:\s*\(Hist\.\))?:?\s*([$\d,\.]+)"))
+        high_balance = _to_float(find_ext(_HB_HIST_OPT_RE))
         if high_balance is None:
-            high_balance = _to_float(find_ext(r"High Balance\s*\(Hist\.\)\s*:?\s*([$\d,\.]+)"))
+            high_balance = _to_float(find_ext(_HB_HIST_RE))
         if high_balance is None:
-            high_balance = _to_float(find_ext(r"High Balance[^\n]*?([$\d,\.]+)"))
+            high_balance = _to_float(find_ext(_HB_LINE_RE))
         if high_balance is None:
-            mhi = re.search(r"High Balance[^\n]*?\n\s*([$\d,\.]+)", block_ext, re.I)
+            mhi = _HB_NEXT_LINE_RE.search(block_ext)
             if mhi:
                 high_balance = _to_float(mhi.group(1))
-        pay_status = find(r"Pay Status:?\s*([^\n]+)") or ""
-        terms = find(r"Terms:?\s*([^\n]+)")
-        masked_number = find(r"(?:Account Number|Acct\s*#|Account\s*#)\s*:?\s*([^\n]+)")
+        pay_status = fields.get("pay_status") or ""
+        terms = fields.get("terms")
+        masked_number = fields.get("masked_number")
 
         # Remarks: capture lines after a 'Remarks' label until blank line or next heading
         remarks: List[str] = []
-        rm = re.search(r"Remarks:?\s*([^\n]+)", block, re.I)
-        if rm:
-            remarks.append(rm.group(1).strip())
+        rm = fields.get("remarks")
+        if rm is not None:
+            remarks.append(rm)
 
         payment_history = _parse_payment_history(block_ext)
 
@@ -332,7 +646,7 @@ def _parse_accounts(section: str) -> Tuple[List[Account], List[str]]:
         high_balance = clamp_nonneg(high_balance)
         balance = clamp_nonneg(balance)
         monthly_payment = clamp_nonneg(monthly_payment)
-        past_due_val = clamp_nonneg(_to_float(find(r"Past Due:?\s*([$\d,\.]+)")))
+        past_due_val = clamp_nonneg(_to_float(fields.get("past_due")))
 
         # Prefer limit; if missing, use latest high balance as proxy
         if credit_limit is None and high_balance is not None:
@@ -357,17 +671,16 @@ def _parse_accounts(section: str) -> Tuple[List[Account], List[str]]:
             )
         )
 
-    return accounts, raw_blocks
+    return accounts
 
 
 DATE_PAT = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})")
 
 
-def _parse_inquiries(section: str, kind: Literal["hard", "soft", "promotional", "account_review"]) -> Tuple[List[Inquiry], List[str]]:
+def _parse_inquiries(section: str, kind: Literal["hard", "soft", "promotional", "account_review"]) -> List[Inquiry]:
     inquiries: List[Inquiry] = []
-    blocks: List[str] = []
     if not section.strip():
-        return inquiries, blocks
+        return inquiries
 
     lines = [ln for ln in section.splitlines()]
     i = 0
@@ -389,53 +702,53 @@ def _parse_inquiries(section: str, kind: Literal["hard", "soft", "promotional",
                         name = lines[j].strip()
                         break
                     j -= 1
-            blk = ln
-            blocks.append(blk)
             if name and dt:
                 inquiries.append(Inquiry(name=name, kind=kind, date=dt))
         else:
             # Look for "Inquiry Date: mm/dd/yyyy" pattern
-            m2 = re.search(r"Inquiry Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})", ln, re.I)
+            m2 = _INQUIRY_DATE_LABEL_RE.search(ln)
             if m2:
                 dt = _parse_date(m2.group(1))
                 # name likely on same line before label or previous line
                 name = ln.split("Inquiry Date")[0].strip(" -:") or (lines[i - 1].strip() if i > 0 else None)
-                blocks.append(ln)
                 if name and dt:
                     inquiries.append(Inquiry(name=name, kind=kind, date=dt))
         i += 1
 
-    return inquiries, blocks
+    return inquiries
 
 
-def parse(text: str) -> CreditReport:
+def parse(text: str, *, already_cleaned: bool = False) -> CreditReport:
     """Parse a TransUnion report text into a CreditReport model.
 
     Heuristics expect sections with headings like:
     - "Satisfactory Accounts" followed by per-account "Account Information" blocks.
     - "Inquiries", "Promotional Inquiries", "Account Review Inquiries".
+
+    Callers that already ran clean_text (parse_any) pass already_cleaned=True
+    to avoid re-cleaning the full text.
     """
     # Clean text to remove icons and page breaks
-    text = clean_text(text)
-    # Sections
-    acc_s, acc_e = _find_span(
-        text, ACCOUNTS_HDR, [INQUIRIES_HDR, PROMO_HDR, REVIEW_HDR]
-    )
+    if not already_cleaned:
+        text = clean_text(text)
+    # Sections: one walk over the text locates all four headers
+    spans = _section_spans(text)
+    acc_s, acc_e = spans["accounts"]
     accounts_section = text[acc_s:acc_e] if acc_s != -1 else ""
 
-    inq_s, inq_e = _find_span(text, INQUIRIES_HDR, [PROMO_HDR, REVIEW_HDR])
+    inq_s, inq_e = spans["inquiries"]
     inq_section = text[inq_s:inq_e] if inq_s != -1 else ""
 
-    promo_s, promo_e = _find_span(text, PROMO_HDR, [REVIEW_HDR])
+    promo_s, promo_e = spans["promo"]
     promo_section = text[promo_s:promo_e] if promo_s != -1 else ""
 
-    rev_s, rev_e = _find_span(text, REVIEW_HDR, [])
+    rev_s, rev_e = spans["review"]
     review_section = text[rev_s:rev_e] if rev_s != -1 else ""
 
-    accounts, account_blocks = _parse_accounts(accounts_section)
-    hard_inquiries, hard_blocks = _parse_inquiries(inq_section, "hard")
-    promo_inquiries, promo_blocks = _parse_inquiries(promo_section, "promotional")
-    review_inquiries, review_blocks = _parse_inquiries(review_section, "account_review")
+    accounts = _parse_accounts(accounts_section)
+    hard_inquiries = _parse_inquiries(inq_section, "hard")
+    promo_inquiries = _parse_inquiries(promo_section, "promotional")
+    review_inquiries = _parse_inquiries(review_section, "account_review")
 
     inquiries = hard_inquiries + promo_inquiries + review_inquiries
 
@@ -447,15 +760,14 @@ def parse(text: str) -> CreditReport:
         inquiries=inquiries,
         public_records=[],
         summary={},
+        # Account and inquiry blocks are substrings of their sections, so
+        # storing the four sections keeps the audit trail without copying
+        # every character a second time.
         raw_chunks=[
             accounts_section,
             inq_section,
             promo_section,
             review_section,
-            *account_blocks,
-            *hard_blocks,
-            *promo_blocks,
-            *review_blocks,
         ],
     )
     return report
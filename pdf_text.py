@@ -1,36 +1,78 @@
 from __future__ import annotations
 
 import io
-from typing import Any, Dict, List, Literal, Union
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Literal, Tuple, Union
 
 
 PAGE_BREAK = "\n\n===PAGE {i}===\n\n"
 
+# Thread-pool startup is not worth it for short documents
+_PARALLEL_MIN_PAGES = 4
 
-def _extract_with_pymupdf(source: Union[str, bytes]) -> List[Dict[str, Any]]:
+
+def _extract_with_pymupdf(source: Union[str, bytes]) -> Tuple[List[str], str]:
     try:
         import fitz  # PyMuPDF
     except Exception as e:  # pragma: no cover
         raise ImportError("PyMuPDF (fitz) is required for primary extraction") from e
 
-    if isinstance(source, (bytes, bytearray)):
-        doc = fitz.open(stream=source, filetype="pdf")
-    else:
-        doc = fitz.open(source)  # type: ignore[arg-type]
+    def _open() -> Any:
+        if isinstance(source, (bytes, bytearray)):
+            return fitz.open(stream=source, filetype="pdf")
+        return fitz.open(source)  # type: ignore[arg-type]
+
+    doc = _open()
+
+    def _one(i: int) -> str:
+        # "text" gives a simple, readable layout suitable for regex parsing
+        return doc.load_page(i).get_text("text") or ""
 
-    pages: List[Dict[str, Any]] = []
     try:
-        for i in range(doc.page_count):
-            page = doc.load_page(i)
-            # "text" gives a simple, readable layout suitable for regex parsing
-            txt = page.get_text("text") or ""
-            pages.append({"n": i, "text": txt})
+        n = doc.page_count
+        texts: List[str] = []
+        if n >= _PARALLEL_MIN_PAGES:
+            # get_text releases the GIL, so page extraction parallelizes
+            # well across threads on multi-page reports. Document objects
+            # are not thread-safe, though, so each worker thread opens its
+            # own copy of the document instead of sharing `doc`.
+            local = threading.local()
+            extras: List[Any] = []
+
+            def _one_parallel(i: int) -> str:
+                d = getattr(local, "doc", None)
+                if d is None:
+                    d = _open()
+                    local.doc = d
+                    extras.append(d)
+                return d.load_page(i).get_text("text") or ""
+
+            try:
+                with ThreadPoolExecutor(max_workers=min(n, os.cpu_count() or 1)) as ex:
+                    texts = list(ex.map(_one_parallel, range(n)))
+            except Exception:
+                # Fall through to the sequential loop below
+                texts = []
+            finally:
+                for d in extras:
+                    d.close()
+        if not texts:
+            texts = [_one(i) for i in range(n)]
+        # Assemble full_text in the same pass over the results (marker
+        # before each non-first page) so the caller never re-joins.
+        chunks: List[str] = []
+        for i, txt in enumerate(texts):
+            if i:
+                chunks.append(PAGE_BREAK.format(i=i))
+            chunks.append(txt)
     finally:
         doc.close()
-    return pages
+    return texts, "".join(chunks)
 
 
-def _extract_with_pdfminer(source: Union[str, bytes]) -> List[Dict[str, Any]]:
+def _extract_with_pdfminer(source: Union[str, bytes]) -> List[str]:
     try:
         from pdfminer.high_level import extract_pages
         from pdfminer.layout import LAParams, LTTextContainer
@@ -43,15 +85,15 @@ def _extract_with_pdfminer(source: Union[str, bytes]) -> List[Dict[str, Any]]:
     else:
         fp = open(source, "rb")  # type: ignore[arg-type]
 
-    pages: List[Dict[str, Any]] = []
+    texts: List[str] = []
     with fp:
-        for i, layout in enumerate(extract_pages(fp, laparams=laparams)):
-            parts: List[str] = []
+        for layout in extract_pages(fp, laparams=laparams):
+            buf = io.StringIO()
             for element in layout:
                 if isinstance(element, LTTextContainer):
-                    parts.append(element.get_text())
-            pages.append({"n": i, "text": "".join(parts)})
-    return pages
+                    buf.write(element.get_text())
+            texts.append(buf.getvalue())
+    return texts
 
 
 def extract_pdf_text(source: Union[str, bytes]) -> Dict[str, Any]:
@@ -61,37 +103,29 @@ def extract_pdf_text(source: Union[str, bytes]) -> Dict[str, Any]:
     - Page breaks in full_text are delimited as "\n\n===PAGE i===\n\n".
     - If initial extraction yields < 500 characters total, falls back to pdfminer.six.
     """
-    # Primary: PyMuPDF
+    # Primary: PyMuPDF. Pages travel as a plain list of strings internally;
+    # the {"n": i, "text": t} wrappers exist only on the returned dict.
     try:
-        pages = _extract_with_pymupdf(source)
+        texts, full_text = _extract_with_pymupdf(source)
     except Exception:
-        pages = []
-
-    full_text = PAGE_BREAK.format(i=0).join(p["text"] for p in pages) if pages else ""
-    if pages:
-        # Ensure page markers exactly as requested (before each non-first page)
-        joined = []
-        for i, p in enumerate(pages):
-            if i > 0:
-                joined.append(PAGE_BREAK.format(i=i))
-            joined.append(p["text"])
-        full_text = "".join(joined)
+        texts = []
+        full_text = ""
 
     # Fallback if insufficient content
     if len(full_text) < 500:
         try:
-            pages = _extract_with_pdfminer(source)
+            texts = _extract_with_pdfminer(source)
             joined = []
-            for i, p in enumerate(pages):
+            for i, t in enumerate(texts):
                 if i > 0:
                     joined.append(PAGE_BREAK.format(i=i))
-                joined.append(p["text"])
+                joined.append(t)
             full_text = "".join(joined)
         except Exception:
             # If fallback fails, keep whatever we have (possibly empty)
             pass
 
-    return {"pages": pages, "full_text": full_text}
+    return {"pages": [{"n": i, "text": t} for i, t in enumerate(texts)], "full_text": full_text}
 
 
 __all__ = ["extract_pdf_text"]
@@ -103,15 +103,28 @@ def eq_pdf() -> Path:
     return _find_sample(SAMPLES["eq"])
 
 
+# Each sample PDF is referenced by several tests; cache parse results for the
+# session (keyed on path + mtime + size so an edited sample re-parses) instead
+# of re-extracting the same document up to four times.
+_PARSE_CACHE: dict = {}
+
+
 def _parse(pdf_path: Path):
     from parse_any import parse_report
 
+    st = pdf_path.stat()
+    key = (str(pdf_path), st.st_mtime_ns, st.st_size)
+    rpt = _PARSE_CACHE.get(key)
+    if rpt is not None:
+        return rpt
+
     rpt = parse_report(str(pdf_path))
     # Ensure it can be serialized
     try:
         json.dumps(rpt.model_dump(), default=str)  # type: ignore[attr-defined]
     except AttributeError:
         json.dumps(rpt.dict(), default=str)
+    _PARSE_CACHE[key] = rpt
     return rpt
 
 
@@ -155,9 +168,9 @@ def test_amex_revolving_limits_and_balance(tu_pdf: Path, ex_pdf: Path):
         bal = amex.balance
         if bal is None and amex.payment_history:
             # pick last non-null
-            for row in sorted(amex.payment_history, key=lambda r: r.get("month", ""), reverse=True):
-                if row.get("balance") is not None:
-                    bal = row["balance"]
+            for row in sorted(amex.payment_history, key=lambda r: r.month, reverse=True):
+                if row.balance is not None:
+                    bal = row.balance
                     break
         assert bal is not None
         assert bal == pytest.approx(1109, rel=0.2)
@@ -5,16 +5,37 @@ import re
 
 PAGE_BREAK_RE = re.compile(r"\n+\s*===PAGE\s+\d+===\s*\n+", re.I)
 
-
-def _is_pua(ch: str) -> bool:
-    o = ord(ch)
-    # Basic Multilingual Plane PUA
-    if 0xE000 <= o <= 0xF8FF:
-        return True
-    # Supplementary Private Use Areas
-    if 0xF0000 <= o <= 0xFFFFD or 0x100000 <= o <= 0x10FFFD:
-        return True
-    return False
+# Character class covering every private-use codepoint (BMP PUA plus both
+# supplementary planes) and the non-breaking space; anything in it
+# normalizes to a regular space.
+_PUA_CLASS = r"\xa0\ue000-\uf8ff\U000f0000-\U000ffffd\U00100000-\U0010fffd"
+
+# One alternation drives the whole cleanup in a single pass over the text:
+# - page-break separators become a newline;
+# - any horizontal run containing a PUA glyph or NBSP becomes one space
+#   (consuming the run whole keeps adjacent spaces/tabs from surviving as
+#   a double space, which the old separate collapse pass would merge);
+# - remaining space/tab runs collapse to one space.
+# Alternative order matters: the run form must win over the plain collapse.
+_CLEAN_RE = re.compile(
+    r"(\n+\s*===PAGE\s+\d+===\s*\n+)"
+    rf"|[ \t{_PUA_CLASS}]*[{_PUA_CLASS}][ \t{_PUA_CLASS}]*"
+    r"|[ \t]{2,}",
+    re.I,
+)
+
+
+# ASCII text (the common case once extractors behave) cannot contain NBSP
+# or PUA glyphs, so a two-alternative pattern suffices; the small class
+# scans measurably faster than the full astral-range one.
+_CLEAN_ASCII_RE = re.compile(
+    r"(\n+\s*===PAGE\s+\d+===\s*\n+)|[ \t]{2,}",
+    re.I,
+)
+
+
+def _clean_repl(m: re.Match[str]) -> str:
+    return "\n" if m.lastindex else " "
 
 
 def clean_text(text: str) -> str:
@@ -25,13 +46,10 @@ def clean_text(text: str) -> str:
     - Normalize non-breaking spaces to regular spaces
     - Tolerate extra whitespace by condensing runs of spaces
     """
-    s = PAGE_BREAK_RE.sub("\n", text or "")
-    s = s.replace("\xa0", " ")
-    s = "".join(" " if _is_pua(c) else c for c in s)
-    # Collapse long runs of spaces (keep newlines)
-    s = re.sub(r"[ \t]{2,}", " ", s)
-    return s
+    s = text or ""
+    # str.isascii() is a flag check in CPython, so the dispatch is free.
+    pat = _CLEAN_ASCII_RE if s.isascii() else _CLEAN_RE
+    return pat.sub(_clean_repl, s)
 
 
 __all__ = ["clean_text"]
-